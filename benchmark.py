@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks de rendimiento del pipeline de CVs
+
+Uso:
+    python benchmark.py docx CARPETA        # Parser DOCX rápido vs python-docx
+    python benchmark.py keywords            # Matcher de keywords vs bucle 'in'
+    python benchmark.py clean               # clean_texts vs clean_text original
+    python benchmark.py vectorizer          # TF-IDF vs hashing en CVClassifier
+    python benchmark.py vectorizer --hybrid # ... y cada uno con características extraídas
+"""
+
+import sys
+import os
+import random
+import re
+import time
+import argparse
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+ROOT_DIR = Path(__file__).parent
+sys.path.insert(0, str(ROOT_DIR))
+
+
+def list_files(folder, extensions):
+    """Lista recursivamente los archivos con las extensiones indicadas"""
+    files = []
+    for root, _, names in os.walk(folder):
+        for name in sorted(names):
+            if os.path.splitext(name.lower())[1] in extensions:
+                files.append(os.path.join(root, name))
+    return files
+
+
+def time_call(func, *args, repeat=1):
+    """Retorna (resultado, mejor tiempo en segundos) de varias ejecuciones"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def synthetic_texts(num_docs, words_per_doc, keyword_ratio=0.05, seed=42):
+    """Genera textos de CV sintéticos mezclando keywords y vocabulario común"""
+    from src.utils.skill_taxonomy import get_default_taxonomy
+
+    taxonomy = get_default_taxonomy()
+    filler = ('experiencia en el área de desarrollo gestión de equipos trabajo '
+              'responsable de proyectos años empresa semana reuniones clientes '
+              'objetivos resultados análisis informes herramientas').split()
+    keywords = taxonomy.skill_keywords + taxonomy.education_keywords
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(keywords) if rng.random() < keyword_ratio else rng.choice(filler)
+                     for _ in range(words_per_doc))
+            for _ in range(num_docs)]
+
+
+def benchmark_keywords(args):
+    """Compara el matcher de keywords con el bucle original de 'in'"""
+    from src.utils.skill_taxonomy import get_default_taxonomy
+
+    taxonomy = get_default_taxonomy()
+    texts = synthetic_texts(args.docs, args.words, args.keyword_ratio)
+    keywords = taxonomy.education_keywords + taxonomy.skill_keywords
+
+    def substring_loop():
+        return [[k for k in keywords if k in text] for text in texts]
+
+    def matcher():
+        return [taxonomy.matcher.find_all(text) for text in texts]
+
+    old_hits, old_time = time_call(substring_loop, repeat=args.repeat)
+    new_hits, new_time = time_call(matcher, repeat=args.repeat)
+
+    old_count = sum(len(hits) for hits in old_hits)
+    new_count = sum(len(hits) for hits in new_hits)
+
+    print(f"🔎 {len(texts)} textos de {args.words} palabras, {len(keywords)} keywords")
+    print(f"   Bucle 'in':  {old_time:.3f}s ({len(texts) / old_time:.0f} textos/s), "
+          f"{old_count} keywords distintas encontradas")
+    print(f"   Matcher:     {new_time:.3f}s ({len(texts) / new_time:.0f} textos/s), "
+          f"{new_count} keywords distintas encontradas (solo palabra completa)")
+    print(f"   Relación:    x{old_time / new_time:.2f}")
+
+
+def legacy_clean_text(text):
+    """Implementación original de CVProcessor.clean_text (referencia)"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'[^\w\s\.\@\-\+\(\),;:]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    lines = text.split('\n')
+    clean_lines = [line.strip() for line in lines if len(line.strip()) > 3]
+    return ' '.join(clean_lines).strip()
+
+
+def benchmark_clean(args):
+    """Mide el throughput de la limpieza de texto por lotes"""
+    from src.utils.cv_processor import CVProcessor
+
+    texts = [text.title().replace(' ', ' | ', 20) for text in synthetic_texts(args.docs, args.words)]
+    processor = CVProcessor()
+    total_mb = sum(len(text) for text in texts) / (1024 * 1024)
+
+    cases = [
+        ('clean_text original', lambda: [legacy_clean_text(text) for text in texts]),
+        ('clean_texts', lambda: processor.clean_texts(texts)),
+        ('clean_texts + acentos', lambda: processor.clean_texts(texts, fold_accents=True)),
+        ('clean_texts + acentos + NFKC',
+         lambda: processor.clean_texts(texts, fold_accents=True, normalize_unicode=True)),
+    ]
+
+    print(f"🧹 {len(texts)} textos ({total_mb:.1f} MB)")
+    reference = None
+    for name, func in cases:
+        result, seconds = time_call(func, repeat=args.repeat)
+        if reference is None:
+            reference = result
+        same = "idéntico" if result == reference else "distinto (normalizado)"
+        print(f"   {name:<30} {seconds:.2f}s  {len(texts) / seconds:>9.0f} textos/s  "
+              f"{total_mb / seconds:.1f} MB/s  [{same}]")
+
+
+def labeled_texts(num_docs, words_per_doc, num_classes, noise_vocab, seed=42):
+    """Genera CVs sintéticos etiquetados: cada profesión favorece sus keywords
+    
+    noise_vocab palabras aleatorias (nombres, empresas, siglas) simulan el
+    vocabulario abierto de un corpus real, que es lo que hace crecer TF-IDF.
+    """
+    from src.utils.skill_taxonomy import get_default_taxonomy
+
+    taxonomy = get_default_taxonomy()
+    rng = random.Random(seed)
+    keywords = taxonomy.skill_keywords + taxonomy.education_keywords
+    filler = synthetic_texts(1, 200, keyword_ratio=0, seed=seed)[0].split()
+    noise = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 10)))
+             for _ in range(noise_vocab)]
+    class_keywords = [rng.sample(keywords, min(len(keywords), 40)) for _ in range(num_classes)]
+
+    data = []
+    for index in range(num_docs):
+        label = index % num_classes
+        words = []
+        for _ in range(words_per_doc):
+            draw = rng.random()
+            if draw < 0.04:
+                words.append(rng.choice(class_keywords[label]))
+            elif draw < 0.06:
+                words.append(rng.choice(keywords))
+            elif draw < 0.26:
+                words.append(rng.choice(noise))
+            else:
+                words.append(rng.choice(filler))
+        data.append({'status': 'success', 'profession': f'profesion_{label}', 'text': ' '.join(words)})
+    return data
+
+
+def _vectorizer_case(args, vectorizer, train, hybrid=False):
+    """Ajusta solo el vectorizador o entrena un CVClassifier completo
+
+    Con hybrid el entrenamiento une a la matriz de texto las características
+    de extract_features (modo híbrido de train_model).
+
+    Se ejecuta en un proceso nuevo y retorna tiempo, incremento del pico de
+    RSS, tamaño serializado del vectorizador, columnas y precisión.
+    """
+    import resource
+    import tempfile
+    from src.models.cv_classifier import CVClassifier
+
+    data = labeled_texts(args.docs, args.words, args.classes, args.noise_vocab)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    accuracy = None
+    with tempfile.TemporaryDirectory() as model_dir:
+        classifier = CVClassifier(model_dir=model_dir)
+        start = time.perf_counter()
+        if train:
+            results = classifier.train_model(data, model_type=args.model, vectorizer=vectorizer,
+                                             hashing_features=args.hashing_features,
+                                             n_jobs=args.jobs, use_engineered_features=hybrid)
+            accuracy = results['accuracy']
+        else:
+            texts = [cv['text'] for cv in data]
+            classifier.vectorizer = CVClassifier.build_vectorizer(
+                len(texts), vectorizer, args.hashing_features, args.jobs
+            )
+            classifier.vectorizer.fit_transform(texts)
+        seconds = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'seconds': seconds,
+        # ru_maxrss está en KB en Linux
+        'rss_mb': (rss_after - rss_before) / 1024,
+        'vectorizer_kb': len(pickle.dumps(classifier.vectorizer)) / 1024,
+        'features': results['features'] if train else classifier.vectorizer.max_features,
+        'accuracy': accuracy
+    }
+
+
+def benchmark_vectorizer(args):
+    """Compara TfidfVectorizer con HashingTfidfVectorizer en CVClassifier"""
+    print(f"🧮 {args.docs} CVs de {args.words} palabras, {args.classes} profesiones, "
+          f"modelo {args.model}, hashing de {args.hashing_features} columnas")
+    for train in (False, True):
+        print("   Entrenamiento completo:" if train else "   Solo vectorización (fit_transform):")
+        cases = [(vectorizer, False) for vectorizer in ('tfidf', 'hashing')]
+        if train and args.hybrid:
+            cases += [(vectorizer, True) for vectorizer in ('tfidf', 'hashing')]
+        for vectorizer, hybrid in cases:
+            # Un proceso por caso para que el pico de RSS no se mezcle
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                stats = executor.submit(_vectorizer_case, args, vectorizer, train, hybrid).result()
+            accuracy = f"  precisión {stats['accuracy']:.3f}" if train else ''
+            name = f"{vectorizer}+feat" if hybrid else vectorizer
+            print(f"      {name:<12} {stats['seconds']:7.2f}s  RSS +{stats['rss_mb']:7.1f} MB  "
+                  f"vectorizador {stats['vectorizer_kb']:9.1f} KB  "
+                  f"{stats['features']:>7} columnas{accuracy}")
+
+
+def benchmark_docx(args):
+    """Compara el parser DOCX en streaming con python-docx"""
+    from src.utils.cv_processor import CVProcessor
+    from src.utils import docx_fast
+
+    files = list_files(args.folder, {'.docx'})
+    if not files:
+        print(f"❌ No se encontraron archivos .docx en {args.folder}")
+        return
+
+    processor = CVProcessor()
+    total_fast = 0.0
+    total_old = 0.0
+    mismatches = 0
+
+    print(f"📄 Comparando {len(files)} archivos DOCX (mejor de {args.repeat})...")
+    for file_path in files:
+        (fast_text, _), fast_time = time_call(docx_fast.extract_docx_text, file_path,
+                                              repeat=args.repeat)
+        old_text, old_time = time_call(processor._extract_from_word_docx, file_path, {},
+                                       repeat=args.repeat)
+        total_fast += fast_time
+        total_old += old_time
+
+        # Mismas palabras (el orden puede variar: el parser rápido respeta el documento)
+        if sorted(fast_text.split()) != sorted(old_text.split()):
+            mismatches += 1
+
+    print(f"   python-docx:   {total_old:.3f}s ({len(files) / total_old:.1f} archivos/s)")
+    print(f"   streaming XML: {total_fast:.3f}s ({len(files) / total_fast:.1f} archivos/s)")
+    print(f"   Aceleración:   x{total_old / total_fast:.1f}")
+    print(f"   Archivos con texto distinto: {mismatches}")
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(
+        description="Benchmarks de rendimiento del Clasificador de CVs",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    docx_parser = subparsers.add_parser('docx', help='Parser DOCX rápido vs python-docx')
+    docx_parser.add_argument('folder', help='Carpeta con archivos .docx')
+    docx_parser.add_argument('--repeat', type=int, default=3, help='Repeticiones por archivo')
+    docx_parser.set_defaults(func=benchmark_docx)
+
+    keywords_parser = subparsers.add_parser('keywords', help="Matcher de keywords vs bucle 'in'")
+    keywords_parser.add_argument('--docs', type=int, default=2000, help='Número de textos')
+    keywords_parser.add_argument('--words', type=int, default=600, help='Palabras por texto')
+    keywords_parser.add_argument('--keyword-ratio', type=float, default=0.05,
+                                 help='Proporción de palabras que son keywords')
+    keywords_parser.add_argument('--repeat', type=int, default=3, help='Repeticiones')
+    keywords_parser.set_defaults(func=benchmark_keywords)
+
+    clean_parser = subparsers.add_parser('clean', help='clean_texts vs clean_text original')
+    clean_parser.add_argument('--docs', type=int, default=100000, help='Número de textos')
+    clean_parser.add_argument('--words', type=int, default=600, help='Palabras por texto')
+    clean_parser.add_argument('--repeat', type=int, default=1, help='Repeticiones')
+    clean_parser.set_defaults(func=benchmark_clean)
+
+    vectorizer_parser = subparsers.add_parser('vectorizer', help='TF-IDF vs hashing en CVClassifier')
+    vectorizer_parser.add_argument('--docs', type=int, default=5000, help='Número de CVs')
+    vectorizer_parser.add_argument('--words', type=int, default=400, help='Palabras por CV')
+    vectorizer_parser.add_argument('--classes', type=int, default=8, help='Número de profesiones')
+    vectorizer_parser.add_argument('--noise-vocab', type=int, default=50000,
+                                   help='Palabras aleatorias del vocabulario abierto')
+    vectorizer_parser.add_argument('--model', default='logistic_regression',
+                                   help='Tipo de modelo de CVClassifier')
+    vectorizer_parser.add_argument('--hashing-features', type=int, default=2 ** 16,
+                                   help='Columnas del espacio de hashing')
+    vectorizer_parser.add_argument('--jobs', type=int, default=1,
+                                   help='Procesos para vectorizar con hashing')
+    vectorizer_parser.add_argument('--hybrid', action='store_true',
+                                   help='Añadir el modo híbrido (texto + características)')
+    vectorizer_parser.set_defaults(func=benchmark_vectorizer)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,10 @@ class Settings:
     MODELS_DIR = BASE_DIR / "models"
     DEEP_MODELS_DIR = BASE_DIR / "deep_models"
     DOCS_DIR = BASE_DIR / "docs"
+    CACHE_DIR = BASE_DIR / "cache"
+    
+    # Taxonomía de habilidades y educación (se recarga al modificarse)
+    SKILLS_TAXONOMY_PATH = SRC_DIR / "config" / "skills_taxonomy.json"
     TESTS_DIR = BASE_DIR / "tests"
     
     # Datos de ejemplo
@@ -34,7 +38,18 @@ class Settings:
             'logistic_regression': 'Logistic Regression',
             'svm': 'Support Vector Machine (SVM)',
             'naive_bayes': 'Naive Bayes'
-        }
+        },
+        # TF-IDF + características de extract_features (habilidades, experiencia...)
+        'use_engineered_features': False,
+        'engineered_weight': 1.0,
+        # Descartar CVs casi duplicados (similitud de Jaccard estimada con
+        # MinHash); None desactiva la deduplicación
+        'dedup_threshold': None,
+        # 'tfidf' (vocabulario ajustado) o 'hashing' (espacio fijo, sin
+        # vocabulario: memoria constante y vectorización en paralelo)
+        'vectorizer': 'tfidf',
+        'hashing_features': 2 ** 16,
+        'vectorizer_jobs': 1
     }
     
     # Configuración de Deep Learning
@@ -60,8 +75,48 @@ class Settings:
     # Configuración de procesamiento de CVs
     CV_PROCESSING = {
         'supported_formats': ['.pdf', '.docx', '.txt', '.doc'],
+        # Archivos mayores se leen parcialmente (PDF/DOCX) u omiten; ver utils.preflight
         'max_file_size_mb': 10,
-        'encoding': 'utf-8'
+        # Imágenes con más píxeles se decodifican reducidas (x2, x4 u x8)
+        'max_image_pixels': 40000000,
+        'encoding': 'utf-8',
+        # Procesamiento paralelo (workers <= 1 usa el modo secuencial)
+        'workers': os.cpu_count() or 1,
+        'chunksize': 4,
+        # Caché de extracción direccionada por contenido
+        'cache_enabled': True,
+        'cache_max_size_mb': 1024,
+        # Guardar el corpus extraído (CorpusStore) para reentrenar sin extraer
+        'corpus_store_enabled': True,
+        # OCR de páginas PDF escaneadas (sin capa de texto)
+        'pdf_ocr_dpi': 200,
+        'pdf_max_ocr_pages': 10,
+        # Extracción paralela por páginas (solo PDFs con muchas páginas)
+        'pdf_page_workers': 1,
+        'pdf_parallel_min_pages': 20,
+        # Presupuesto de extracción ('max_chars', 'max_pages', 'max_ocr_pages');
+        # None extrae el documento completo
+        'extraction_budget': None,
+        # Normalización del texto limpio
+        'fold_accents': False,
+        'normalize_unicode': False,
+        # Aislamiento por archivo: tiempo máximo y techo de memoria por proceso
+        # (None desactiva el límite; con ambos en None no se aísla). El techo
+        # es el crecimiento del RSS por archivo; queda desactivado hasta
+        # medir el consumo real de un corpus
+        'file_timeout_s': 120,
+        'memory_limit_mb': None
+    }
+    
+    # Configuración del motor OCR
+    OCR_CONFIG = {
+        'language': 'spa',
+        'workers': 2,  # APIs Tesseract persistentes por proceso
+        'psm': 6,
+        'oem': 3,
+        # Detectar el idioma de cada documento y usar spa, eng o spa+eng
+        # (desactivado hasta medir su costo: añade una pasada de OCR por documento)
+        'auto_language': False
     }
     
     # Configuración de la GUI
@@ -76,7 +131,17 @@ class Settings:
     LOGGING_CONFIG = {
         'level': 'INFO',
         'format': '[%(asctime)s] %(levelname)s: %(message)s',
-        'date_format': '%H:%M:%S'
+        'date_format': '%H:%M:%S',
+        # Registro JSONL con el detalle por archivo, desactivado por defecto
+        # (p. ej. str(CACHE_DIR / "pipeline_log.jsonl")); rota al llegar a
+        # jsonl_max_mb y conserva jsonl_backups copias
+        'jsonl_path': None,
+        'jsonl_level': 'DEBUG',
+        'jsonl_max_mb': 50,
+        'jsonl_backups': 3,
+        # Progreso agregado: un mensaje cada N archivos o T segundos
+        'progress_every_n': 500,
+        'progress_every_s': 5.0
     }
     
     @classmethod
@@ -87,7 +152,8 @@ class Settings:
             cls.MODELS_DIR,
             cls.DEEP_MODELS_DIR,
             cls.DOCS_DIR,
-            cls.TESTS_DIR
+            cls.TESTS_DIR,
+            cls.CACHE_DIR
         ]
         
         for directory in directories:
@@ -101,6 +167,21 @@ class Settings:
         else:
             return cls.MODELS_DIR / f"{model_name}.pkl"
     
+    @classmethod
+    def get_extraction_cache_path(cls):
+        """Obtiene la ruta de la base de datos de caché de extracción"""
+        return cls.CACHE_DIR / "extraction_cache.sqlite3"
+    
+    @classmethod
+    def get_corpus_store_path(cls):
+        """Obtiene la ruta de la base de datos del corpus extraído"""
+        return cls.CACHE_DIR / "corpus_store.sqlite3"
+    
+    @classmethod
+    def get_metrics_path(cls):
+        """Obtiene la ruta del JSON con las métricas por etapa de la última ejecución"""
+        return cls.CACHE_DIR / "pipeline_metrics.json"
+    
     @classmethod
     def get_sample_cvs_path(cls):
         """Obtiene la ruta de los CVs de ejemplo"""
@@ -118,9 +118,11 @@ def run_gui():
         from PyQt6.QtWidgets import QApplication
         from src.gui.main_gui import CVClassifierGUI
         from src.config.settings import Settings
+        from src.utils.logging_utils import configure_logging
         
         # Asegurar que los directorios existan
         Settings.ensure_directories()
+        configure_logging(Settings.LOGGING_CONFIG)
         
         # Crear aplicación
         app = QApplication(sys.argv)
@@ -7,6 +7,8 @@ Versión con diseño inspirado en Driver Booster.
 import sys
 import os
 import json
+import logging
+from contextlib import contextmanager
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QTextEdit,
                              QGroupBox, QGridLayout, QFileDialog, QMessageBox,
@@ -20,18 +22,128 @@ from PyQt6.QtGui import QFont, QTextCursor, QColor, QIcon, QPixmap, QPainter, QB
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.utils.cv_processor import CVProcessor
+from src.utils.extraction_cache import ExtractionCache
+from src.utils.ocr_engine import OCREngine
+from src.utils.skill_taxonomy import SkillTaxonomy
+from src.utils.corpus_store import CorpusStore
+from src.utils.logging_utils import ROOT_LOGGER, configure_logging
 from src.models.cv_classifier import CVClassifier
 from src.config.settings import Settings
 
+logger = logging.getLogger(__name__)
+
 # Importar Deep Learning Classifier (opcional)
 try:
     from src.models.deep_learning_classifier import DeepLearningClassifier
     DEEP_LEARNING_AVAILABLE = True
-    print("✅ Deep Learning disponible")
+    logger.debug("Deep Learning disponible")
 except ImportError as e:
     DEEP_LEARNING_AVAILABLE = False
-    print(f"⚠️ Deep Learning no disponible: {e}")
-    print("    Para usar Deep Learning, instala: pip install tensorflow transformers")
+    logger.warning("Deep Learning no disponible: %s. Para usarlo, instala: "
+                   "pip install tensorflow transformers", e)
+
+def create_processor():
+    """Crea el procesador configurado en Settings
+    
+    Entrenamiento y predicción deben usar el mismo, o el texto limpio (por
+    ejemplo con acentos plegados) no coincide con el vocabulario del modelo.
+    """
+    cache = None
+    if Settings.CV_PROCESSING['cache_enabled']:
+        cache = ExtractionCache(
+            Settings.get_extraction_cache_path(),
+            max_size_mb=Settings.CV_PROCESSING['cache_max_size_mb']
+        )
+    ocr_engine = OCREngine(
+        lang=Settings.OCR_CONFIG['language'],
+        workers=Settings.OCR_CONFIG['workers'],
+        psm=Settings.OCR_CONFIG['psm'],
+        oem=Settings.OCR_CONFIG['oem']
+    )
+    return CVProcessor(
+        cache=cache,
+        ocr_engine=ocr_engine,
+        pdf_ocr_dpi=Settings.CV_PROCESSING['pdf_ocr_dpi'],
+        pdf_max_ocr_pages=Settings.CV_PROCESSING['pdf_max_ocr_pages'],
+        pdf_page_workers=Settings.CV_PROCESSING['pdf_page_workers'],
+        pdf_parallel_min_pages=Settings.CV_PROCESSING['pdf_parallel_min_pages'],
+        extraction_budget=Settings.CV_PROCESSING['extraction_budget'],
+        taxonomy=SkillTaxonomy(Settings.SKILLS_TAXONOMY_PATH),
+        fold_accents=Settings.CV_PROCESSING['fold_accents'],
+        normalize_unicode=Settings.CV_PROCESSING['normalize_unicode'],
+        max_file_size_mb=Settings.CV_PROCESSING['max_file_size_mb'],
+        max_image_pixels=Settings.CV_PROCESSING['max_image_pixels'],
+        ocr_auto_language=Settings.OCR_CONFIG['auto_language'],
+        progress_every_n=Settings.LOGGING_CONFIG['progress_every_n'],
+        progress_every_s=Settings.LOGGING_CONFIG['progress_every_s']
+    )
+
+class SignalLogHandler(logging.Handler):
+    """Reenvía los registros del log a una señal de progreso de la GUI"""
+
+    def __init__(self, signal, level=logging.INFO):
+        super().__init__(level)
+        self.signal = signal
+        self.setFormatter(logging.Formatter('%(message)s'))
+
+    def emit(self, record):
+        try:
+            self.signal.emit(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+@contextmanager
+def forward_logs(progress_signal):
+    """Muestra en la GUI los mensajes INFO del pipeline mientras dura el bloque
+    
+    El progreso por archivo ya llega agregado (cada N archivos o T
+    segundos), así que la señal no satura el hilo de la interfaz.
+    """
+    handler = SignalLogHandler(progress_signal)
+    app_logger = logging.getLogger(ROOT_LOGGER)
+    app_logger.addHandler(handler)
+    try:
+        yield
+    finally:
+        app_logger.removeHandler(handler)
+
+def iter_training_corpus(processor, profession_folders, progress_signal):
+    """Genera los CVs de todas las profesiones informando el progreso
+    
+    Si el almacén de corpus está habilitado, los resultados se guardan a
+    medida que pasan para poder reentrenar sin volver a extraer.
+    """
+    store = None
+    if Settings.CV_PROCESSING['corpus_store_enabled']:
+        store = CorpusStore(Settings.get_corpus_store_path())
+    for profession, folder_path in profession_folders.items():
+        progress_signal.emit(f"📁 Procesando profesión: {profession}")
+        results = processor.iter_cv_folder(
+            folder_path, profession,
+            workers=Settings.CV_PROCESSING['workers'],
+            chunksize=Settings.CV_PROCESSING['chunksize'],
+            file_timeout=Settings.CV_PROCESSING['file_timeout_s'],
+            memory_limit_mb=Settings.CV_PROCESSING['memory_limit_mb']
+        )
+        if store is not None:
+            results = store.write_through(results)
+        yield from results
+
+def emit_pipeline_metrics(processor, progress_signal):
+    """Informa los tiempos por etapa y formato y los exporta a JSON"""
+    metrics_path = Settings.get_metrics_path()
+    processor.metrics.to_json(metrics_path)
+    for line in processor.metrics.format_summary().splitlines():
+        progress_signal.emit(f"⏱️ {line}")
+    progress_signal.emit(f"⏱️ Métricas guardadas en {metrics_path}")
+
+def emit_cache_stats(processor, progress_signal):
+    """Informa los aciertos y fallos de la caché de extracción"""
+    cache_stats = processor.get_cache_stats()
+    if cache_stats:
+        progress_signal.emit(
+            f"🗃️ Caché: {cache_stats['hits']} aciertos, {cache_stats['misses']} fallos"
+        )
 
 class TrainingThread(QThread):
     """Hilo para entrenamiento en segundo plano"""
@@ -48,24 +160,32 @@ class TrainingThread(QThread):
         try:
             self.progress_updated.emit("🔄 Iniciando procesamiento de CVs...")
             
-            processor = CVProcessor()
-            all_cv_data = []
-            
-            for profession, folder_path in self.profession_folders.items():
-                self.progress_updated.emit(f"📁 Procesando profesión: {profession}")
-                cv_results = processor.process_cv_folder(folder_path, profession)
-                all_cv_data.extend(cv_results)
-            
-            if not all_cv_data:
-                self.training_completed.emit(False, {}, "No se encontraron CVs válidos")
-                return
-            
-            self.progress_updated.emit(f"✅ Procesados {len(all_cv_data)} CVs")
+            processor = create_processor()
             
             self.progress_updated.emit("🤖 Entrenando modelo de clasificación...")
             classifier = CVClassifier()
             
-            results = classifier.train_model(all_cv_data, model_type=self.model_type)
+            # Los CVs se consumen en streaming mientras se procesan
+            with forward_logs(self.progress_updated):
+                results = classifier.train_model(
+                    iter_training_corpus(processor, self.profession_folders, self.progress_updated),
+                    model_type=self.model_type,
+                    use_engineered_features=Settings.ML_CONFIG['use_engineered_features'],
+                    engineered_weight=Settings.ML_CONFIG['engineered_weight'],
+                    dedup_threshold=Settings.ML_CONFIG['dedup_threshold'],
+                    vectorizer=Settings.ML_CONFIG['vectorizer'],
+                    hashing_features=Settings.ML_CONFIG['hashing_features'],
+                    n_jobs=Settings.ML_CONFIG['vectorizer_jobs'],
+                    taxonomy=processor.taxonomy
+                )
+            
+            self.progress_updated.emit(f"✅ Procesados {results['total_samples']} CVs")
+            if results['duplicates_removed']:
+                self.progress_updated.emit(
+                    f"🧬 Casi duplicados descartados: {results['duplicates_removed']}"
+                )
+            emit_cache_stats(processor, self.progress_updated)
+            emit_pipeline_metrics(processor, self.progress_updated)
             
             self.progress_updated.emit(f"💾 Guardando modelo '{self.model_name}'...")
             classifier.save_model(self.model_name)
@@ -96,35 +216,28 @@ class DeepLearningTrainingThread(QThread):
 
             self.progress_updated.emit("🔄 Iniciando procesamiento de CVs para Deep Learning...")
 
-            from src.utils.cv_processor import CVProcessor 
-            processor = CVProcessor()
-            all_cv_data = []
-
-            for profession, folder_path in self.profession_folders.items():
-                self.progress_updated.emit(f"📁 Procesando profesión: {profession}")
-                cv_results = processor.process_cv_folder(folder_path, profession)
-                all_cv_data.extend(cv_results)
-
-            if not all_cv_data:
-                self.training_completed.emit(False, {}, "No se encontraron CVs válidos")
-                return
-
-            self.progress_updated.emit(f"✅ Procesados {len(all_cv_data)} CVs")
+            processor = create_processor()
 
             self.progress_updated.emit(f"🧠 Entrenando modelo {self.model_type.upper()}...")
             dl_classifier = DeepLearningClassifier()
 
-            results = dl_classifier.train_model(
-                all_cv_data,
-                model_type=self.model_type,
-                epochs=self.epochs,
-                batch_size=self.batch_size
-            )
+            # Los CVs se consumen en streaming mientras se procesan
+            with forward_logs(self.progress_updated):
+                results = dl_classifier.train_model(
+                    iter_training_corpus(processor, self.profession_folders, self.progress_updated),
+                    model_type=self.model_type,
+                    epochs=self.epochs,
+                    batch_size=self.batch_size,
+                    dedup_threshold=Settings.ML_CONFIG['dedup_threshold']
+                )
 
             if not results.get('success', False): 
                 self.training_completed.emit(False, {}, results.get('error', 'Error desconocido durante el entrenamiento DL.'))
                 return
 
+            emit_cache_stats(processor, self.progress_updated)
+            emit_pipeline_metrics(processor, self.progress_updated)
+
             self.progress_updated.emit(f"💾 Guardando modelo Deep Learning '{self.model_name}'...")
             dl_classifier.save_model(self.model_name)
 
@@ -243,7 +356,7 @@ class CVClassifierGUI(QMainWindow):
         # Permitir redimensionar una ventana sin marco (requiere más manejo manual)
         # self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowMinMaxButtonsHint) # No funciona bien solo
 
-        self.processor = CVProcessor()
+        self.processor = create_processor()
         self.classifier = CVClassifier()
         if DEEP_LEARNING_AVAILABLE:
             self.dl_classifier = DeepLearningClassifier()
@@ -1726,7 +1839,7 @@ class CVClassifierGUI(QMainWindow):
 
         except Exception as e:
             QMessageBox.critical(self, "Error de Actualización", f"No se pudo actualizar la lista de modelos:\n{str(e)}")
-            print(f"Error en refresh_models_list: {e}")
+            logger.warning("Error en refresh_models_list: %s", e)
 
 
     def on_model_selection_changed(self):
@@ -1776,7 +1889,7 @@ class CVClassifierGUI(QMainWindow):
                 QMessageBox.critical(self, "Error al Cargar Modelo", f"No se pudo cargar el modelo '{display_name}'. Verifica la integridad del archivo del modelo.")
         except Exception as e:
             QMessageBox.critical(self, "Excepción al Cargar Modelo", f"Ocurrió un error inesperado al intentar cargar el modelo '{display_name}':\n{str(e)}")
-            print(f"Excepción en _load_model_by_data: {e}")
+            logger.warning("Excepción en _load_model_by_data: %s", e)
 
     def update_all_ui_after_model_change(self):
         self.refresh_models_list() 
@@ -2051,7 +2164,7 @@ class CVClassifierGUI(QMainWindow):
 
         except Exception as e:
             QMessageBox.critical(self, "Error de Actualización", f"No se pudo actualizar el selector de modelos:\n{str(e)}")
-            print(f"Error en refresh_model_selector: {e}")
+            logger.warning("Error en refresh_model_selector: %s", e)
 
 
     def on_model_selector_changed(self, index_or_text): # El argumento puede ser índice o texto
@@ -2118,7 +2231,7 @@ class CVClassifierGUI(QMainWindow):
         if not self.current_loaded_model and self.model_selector_combo.count() > 1: # Más que el placeholder
             first_model_data = self.model_selector_combo.itemData(1) # El primer modelo real
             if isinstance(first_model_data, dict):
-                print(f"Intentando cargar automáticamente el primer modelo: {first_model_data.get('display_name')}")
+                logger.info("Intentando cargar automáticamente el primer modelo: %s", first_model_data.get('display_name'))
                 self._load_model_by_data(first_model_data)
         
         self.update_model_status_ui() # Siempre actualizar UI
@@ -2260,11 +2373,11 @@ class CVClassifierGUI(QMainWindow):
             detailed_error = f"Ocurrió un error crítico durante el proceso de clasificación:\n{str(e)}"
             QMessageBox.critical(self, "Error Crítico en Clasificación", detailed_error)
             self.main_result.setHtml(f"<p style='color:red;'>❌ Error crítico: {detailed_error}</p>")
-            import traceback
-            print(f"Error en classify_cv: {e}\n{traceback.format_exc()}")
+            logger.exception("Error en classify_cv: %s", e)
 
 
 def main():
+    configure_logging(Settings.LOGGING_CONFIG)
     app = QApplication(sys.argv)
     # app.setApplicationName("Clasificador de CVs por Profesiones v2.1") # El título se pone en CustomTitleBar
 
@@ -2388,7 +2501,7 @@ class CVClassifier:
                         data.setdefault('professions', [])
                         data.setdefault('is_deep_learning', False)
                         models.append(data)
-                except Exception as e: print(f"Error loading model metadata {f_name}: {e}")
+                except Exception as e: logger.warning("Error loading model metadata %s: %s", f_name, e)
         return sorted(models, key=lambda x: x.get('creation_date', ''), reverse=True)
     def delete_model(self, model_name, is_deep_learning=False): 
         fname = f"{model_name}.json" 
@@ -3,20 +3,126 @@
 Clasificador de CVs por profesiones - Versión simplificada
 """
 
+import logging
 import os
 import pickle
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.svm import SVC
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.metrics import classification_report, accuracy_score
-from sklearn.preprocessing import LabelEncoder
+from sklearn.preprocessing import LabelEncoder, MaxAbsScaler
+from scipy import sparse
 import joblib
 
+from ..utils.cv_processor import CVProcessor
+from ..utils.feature_table import FeatureTableBuilder
+from ..utils.corpus_store import CorpusStore
+from ..utils.dedup import NearDuplicateFilter
+
+logger = logging.getLogger(__name__)
+
+
+class EngineeredFeatureTransformer:
+    """Bloque de características de extract_features escalado para unir a TF-IDF
+    
+    Las columnas (habilidades, educación y numéricas) se escalan con
+    MaxAbsScaler, que conserva la dispersión y los valores no negativos
+    (necesarios para Naive Bayes), y se multiplican por weight para
+    equilibrar el bloque frente a las filas L2-normalizadas de TF-IDF.
+    
+    taxonomy debe ser la del procesador que generó los CVs de entrenamiento
+    (None: la taxonomía por defecto); se guarda con el modelo para que las
+    columnas skill:/edu: de la predicción coincidan con las del ajuste.
+    """
+    
+    def __init__(self, weight=1.0, taxonomy=None):
+        self.weight = weight
+        self.taxonomy = taxonomy
+        self.builder = None
+        self.scaler = None
+        self._processor = None
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_processor'] = None
+        return state
+    
+    @property
+    def processor(self):
+        if self._processor is None:
+            # Modelos guardados antes de conservar la taxonomía no tienen el atributo
+            self._processor = CVProcessor(taxonomy=getattr(self, 'taxonomy', None))
+        return self._processor
+    
+    def _features(self, texts, features_list=None):
+        """Usa las características ya calculadas o las extrae del texto"""
+        if features_list is None:
+            features_list = [None] * len(texts)
+        return [features if features and 'keyword_counts' in features
+                else self.processor.extract_features(text)
+                for text, features in zip(texts, features_list)]
+    
+    def fit_transform(self, texts, features_list=None):
+        self.builder = FeatureTableBuilder.from_taxonomy(self.processor.taxonomy)
+        X = self.builder.to_sparse(self._features(texts, features_list))
+        self.scaler = MaxAbsScaler()
+        return self.scaler.fit_transform(X) * self.weight
+    
+    def transform(self, texts, features_list=None):
+        X = self.builder.to_sparse(self._features(texts, features_list))
+        return self.scaler.transform(X) * self.weight
+
+class HashingTfidfVectorizer:
+    """Vectorizador sin vocabulario: HashingVectorizer + TfidfTransformer opcional
+    
+    Los unigramas y bigramas se proyectan a un espacio fijo de n_features
+    columnas, así que la memoria del ajuste no crece con el corpus y el
+    modelo guardado solo incluye los pesos IDF. Al no tener estado, el
+    hashing se puede repartir en trozos de chunk_size textos entre n_jobs
+    procesos. A diferencia de TfidfVectorizer no aplica min_df ni max_df.
+    """
+    
+    def __init__(self, n_features=2 ** 16, use_idf=True, n_jobs=1, chunk_size=2000):
+        self.n_features = n_features
+        self.use_idf = use_idf
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+        # alternate_sign=False: valores no negativos (necesarios para Naive Bayes)
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None if use_idf else 'l2'
+        )
+        self.idf = TfidfTransformer() if use_idf else None
+    
+    @property
+    def max_features(self):
+        return self.n_features
+    
+    def _hash(self, texts):
+        """Vectoriza en trozos paralelos cuando hay más de un trozo"""
+        if self.n_jobs == 1 or len(texts) <= self.chunk_size:
+            return self.hasher.transform(texts)
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        blocks = joblib.Parallel(n_jobs=self.n_jobs)(
+            joblib.delayed(self.hasher.transform)(chunk) for chunk in chunks
+        )
+        return sparse.vstack(blocks, format='csr')
+    
+    def fit_transform(self, texts):
+        X = self._hash(texts)
+        return self.idf.fit_transform(X) if self.idf is not None else X
+    
+    def transform(self, texts):
+        X = self._hash(texts)
+        return self.idf.transform(X) if self.idf is not None else X
+
 class CVClassifier:
     """Clasificador simplificado de CVs por profesiones"""
     
@@ -25,67 +131,118 @@ class CVClassifier:
         self.vectorizer = None
         self.classifier = None
         self.label_encoder = None
+        # Bloque opcional de características de extract_features (modo híbrido)
+        self.feature_transformer = None
         self.is_trained = False
         
         # Crear directorio de modelos
         os.makedirs(model_dir, exist_ok=True)
     
-    def prepare_training_data(self, cv_data):
-        """Prepara los datos para entrenamiento"""
-        if not cv_data:
+    def prepare_training_data(self, cv_data, with_features=False):
+        """Prepara los datos para entrenamiento
+        
+        cv_data puede ser una lista o cualquier iterable de resultados (por
+        ejemplo CVProcessor.iter_corpus) o un CorpusStore, del que se leen
+        solo las columnas necesarias; solo se conservan texto y etiqueta
+        de los CVs procesados exitosamente (y sus características si
+        with_features es True).
+        """
+        if cv_data is None:
             raise ValueError("No hay datos de CVs para entrenar")
         
-        # Convertir a DataFrame
-        df = pd.DataFrame(cv_data)
+        if isinstance(cv_data, CorpusStore):
+            columns = ('profession', 'text', 'status') + (('features',) if with_features else ())
+            cv_data = cv_data.iter_results(columns=columns)
         
-        # Filtrar solo CVs procesados exitosamente
-        df = df[df['status'] == 'success'].copy()
+        texts = []
+        professions = []
+        features = []
+        total = 0
+        for cv in cv_data:
+            total += 1
+            # Filtrar solo CVs procesados exitosamente
+            if cv.get('status') == 'success':
+                texts.append(cv['text'])
+                professions.append(cv['profession'])
+                if with_features:
+                    features.append(cv.get('features'))
         
-        if len(df) == 0:
-            raise ValueError("No hay CVs procesados exitosamente")
+        if total == 0:
+            raise ValueError("No hay datos de CVs para entrenar")
         
-        # Preparar textos y etiquetas
-        texts = df['text'].tolist()
-        professions = df['profession'].tolist()
+        if len(texts) == 0:
+            raise ValueError("No hay CVs procesados exitosamente")
         
-        print(f"Datos preparados: {len(texts)} CVs, {len(set(professions))} profesiones")
-        print(f"Profesiones: {set(professions)}")
+        logger.info("Datos preparados: %s CVs, %s profesiones", len(texts), len(set(professions)))
+        logger.info("Profesiones: %s", set(professions))
         
+        if with_features:
+            return texts, professions, features
         return texts, professions
     
-    def train_model(self, cv_data, test_size=0.2, model_type='random_forest'):
-        """Entrena el modelo de clasificación"""
-        print("=== INICIANDO ENTRENAMIENTO ===")
+    def train_model(self, cv_data, test_size=0.2, model_type='random_forest',
+                    use_engineered_features=False, engineered_weight=1.0,
+                    dedup_threshold=None, vectorizer='tfidf', hashing_features=2 ** 16,
+                    n_jobs=1, taxonomy=None):
+        """Entrena el modelo de clasificación
+        
+        Con use_engineered_features la matriz TF-IDF se une (en disperso) con
+        las características de extract_features: habilidades, educación,
+        años de experiencia, etc.; taxonomy es la del procesador que generó
+        cv_data (por ejemplo processor.taxonomy), para que las columnas
+        coincidan con las características ya calculadas. Con dedup_threshold
+        se descartan antes los CVs casi duplicados (se conserva el primero
+        de cada grupo).
+        
+        vectorizer='hashing' usa HashingTfidfVectorizer (hashing_features
+        columnas, n_jobs procesos) en lugar de un vocabulario TF-IDF.
+        """
+        if vectorizer not in ('tfidf', 'hashing'):
+            raise ValueError(f"Vectorizador no soportado: {vectorizer}")
+        logger.info("=== INICIANDO ENTRENAMIENTO ===")
+        
+        dedup = None
+        if dedup_threshold:
+            dedup = NearDuplicateFilter(threshold=dedup_threshold)
+            if isinstance(cv_data, CorpusStore):
+                columns = ('file_name', 'profession', 'text', 'status')
+                cv_data = cv_data.iter_results(
+                    columns=columns + (('features',) if use_engineered_features else ())
+                )
+            cv_data = dedup.filter(cv_data)
         
         # Preparar datos
-        texts, professions = self.prepare_training_data(cv_data)
+        if use_engineered_features:
+            texts, professions, cv_features = self.prepare_training_data(cv_data, with_features=True)
+        else:
+            texts, professions = self.prepare_training_data(cv_data)
         
         if len(set(professions)) < 2:
             raise ValueError("Se necesitan al menos 2 profesiones diferentes para entrenar")
         
         # Vectorizar textos
-        print("Vectorizando textos...")
-
-        # Ajustar parámetros según el tamaño del dataset
-        min_df = 1 if len(texts) < 10 else 2
-        max_features = min(5000, len(texts) * 100)
+        logger.info("Vectorizando textos...")
 
-        self.vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            stop_words=None,  # Mantenemos todas las palabras para español
-            ngram_range=(1, 2),  # Unigramas y bigramas
-            min_df=min_df,  # Ajustado según tamaño del dataset
-            max_df=0.95  # Máximo 95% de documentos
-        )
-        
+        self.vectorizer = self.build_vectorizer(len(texts), vectorizer, hashing_features, n_jobs)
         X = self.vectorizer.fit_transform(texts)
         
+        # Modo híbrido: TF-IDF + características extraídas, todo disperso
+        if use_engineered_features:
+            self.feature_transformer = EngineeredFeatureTransformer(weight=engineered_weight,
+                                                                    taxonomy=taxonomy)
+            X_engineered = self.feature_transformer.fit_transform(texts, cv_features)
+            X = sparse.hstack([X, X_engineered], format='csr')
+        else:
+            self.feature_transformer = None
+        
         # Codificar etiquetas
         self.label_encoder = LabelEncoder()
         y = self.label_encoder.fit_transform(professions)
         
-        print(f"Características extraídas: {X.shape[1]}")
-        print(f"Clases: {self.label_encoder.classes_}")
+        if dedup is not None:
+            logger.info("Casi duplicados descartados: %s", len(dedup.duplicates))
+        logger.info("Características extraídas: %s", X.shape[1])
+        logger.info("Clases: %s", self.label_encoder.classes_)
         
         # Dividir datos
         if len(texts) > 4:  # Solo dividir si hay suficientes datos
@@ -96,10 +253,10 @@ class CVClassifier:
             # Con pocos datos, usar todo para entrenamiento
             X_train, X_test = X, X
             y_train, y_test = y, y
-            print("⚠️ Pocos datos: usando todo el dataset para entrenamiento y prueba")
+            logger.warning("Pocos datos: usando todo el dataset para entrenamiento y prueba")
         
         # Entrenar modelo
-        print(f"Entrenando modelo {model_type}...")
+        logger.info("Entrenando modelo %s...", model_type)
 
         if model_type == 'random_forest':
             self.classifier = RandomForestClassifier(
@@ -140,10 +297,10 @@ class CVClassifier:
         y_pred = self.classifier.predict(X_test)
         accuracy = accuracy_score(y_test, y_pred)
         
-        print(f"\n=== RESULTADOS DEL ENTRENAMIENTO ===")
-        print(f"Precisión: {accuracy:.3f}")
-        print(f"Datos de entrenamiento: {X_train.shape[0]}")
-        print(f"Datos de prueba: {X_test.shape[0]}")
+        logger.info("=== RESULTADOS DEL ENTRENAMIENTO ===")
+        logger.info("Precisión: %.3f", accuracy)
+        logger.info("Datos de entrenamiento: %s", X_train.shape[0])
+        logger.info("Datos de prueba: %s", X_test.shape[0])
         
         # Reporte detallado
         if len(set(y_test)) > 1:  # Solo si hay múltiples clases en test
@@ -152,19 +309,40 @@ class CVClassifier:
                 target_names=self.label_encoder.classes_,
                 zero_division=0
             )
-            print("\nReporte de clasificación:")
-            print(report)
+            logger.debug("Reporte de clasificación:\n%s", report)
         
         self.is_trained = True
         
         return {
             'accuracy': accuracy,
+            'total_samples': X.shape[0],
             'train_samples': X_train.shape[0],
             'test_samples': X_test.shape[0],
             'features': X.shape[1],
+            'feature_mode': 'hybrid' if self.feature_transformer else 'tfidf',
+            'vectorizer': vectorizer,
+            'duplicates_removed': len(dedup.duplicates) if dedup is not None else 0,
             'classes': list(self.label_encoder.classes_)
         }
     
+    @staticmethod
+    def build_vectorizer(num_texts, vectorizer='tfidf', hashing_features=2 ** 16, n_jobs=1):
+        """Crea el vectorizador sin ajustar que usa train_model"""
+        if vectorizer == 'hashing':
+            return HashingTfidfVectorizer(n_features=hashing_features, n_jobs=n_jobs)
+        
+        # Ajustar parámetros según el tamaño del dataset
+        min_df = 1 if num_texts < 10 else 2
+        max_features = min(5000, num_texts * 100)
+
+        return TfidfVectorizer(
+            max_features=max_features,
+            stop_words=None,  # Mantenemos todas las palabras para español
+            ngram_range=(1, 2),  # Unigramas y bigramas
+            min_df=min_df,  # Ajustado según tamaño del dataset
+            max_df=0.95  # Máximo 95% de documentos
+        )
+    
     def predict_cv(self, cv_text):
         """Predice la profesión más adecuada para un CV"""
         if not self.is_trained:
@@ -177,8 +355,8 @@ class CVClassifier:
             }
         
         try:
-            # Vectorizar texto
-            X = self.vectorizer.transform([cv_text])
+            # Vectorizar texto (con la misma transformación del entrenamiento)
+            X = self.transform_texts([cv_text])
             
             # Predecir
             prediction = self.classifier.predict(X)[0]
@@ -224,6 +402,13 @@ class CVClassifier:
                 'message': f'Error en la predicción: {str(e)}'
             }
     
+    def transform_texts(self, texts):
+        """Aplica la transformación de entrenamiento (TF-IDF o híbrida)"""
+        X = self.vectorizer.transform(texts)
+        if self.feature_transformer is not None:
+            X = sparse.hstack([X, self.feature_transformer.transform(texts)], format='csr')
+        return X
+    
     def save_model(self, model_name='cv_classifier'):
         """Guarda el modelo entrenado con metadatos"""
         if not self.is_trained:
@@ -242,6 +427,13 @@ class CVClassifier:
             encoder_path = os.path.join(self.model_dir, f'{model_name}_encoder.pkl')
             joblib.dump(self.label_encoder, encoder_path)
 
+            # Guardar transformador de características (solo modo híbrido)
+            features_path = os.path.join(self.model_dir, f'{model_name}_features.pkl')
+            if self.feature_transformer is not None:
+                joblib.dump(self.feature_transformer, features_path)
+            elif os.path.exists(features_path):
+                os.remove(features_path)
+
             # Obtener nombre amigable del algoritmo
             algorithm_names = {
                 'RandomForestClassifier': 'Random Forest',
@@ -261,6 +453,8 @@ class CVClassifier:
                 'model_type': model_type_name,
                 'professions': list(self.label_encoder.classes_),
                 'num_features': self.vectorizer.max_features,
+                'feature_mode': 'hybrid' if self.feature_transformer else 'tfidf',
+                'vectorizer': 'hashing' if isinstance(self.vectorizer, HashingTfidfVectorizer) else 'tfidf',
                 'creation_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'num_professions': len(self.label_encoder.classes_)
             }
@@ -268,16 +462,16 @@ class CVClassifier:
             metadata_path = os.path.join(self.model_dir, f'{model_name}_metadata.pkl')
             joblib.dump(metadata, metadata_path)
 
-            print(f"✅ Modelo '{model_name}' guardado en {self.model_dir}/")
-            print(f"   - {model_name}_vectorizer.pkl")
-            print(f"   - {model_name}_classifier.pkl")
-            print(f"   - {model_name}_encoder.pkl")
-            print(f"   - {model_name}_metadata.pkl")
+            logger.info("Modelo '%s' guardado en %s/", model_name, self.model_dir)
+            logger.info("   - %s_vectorizer.pkl", model_name)
+            logger.info("   - %s_classifier.pkl", model_name)
+            logger.info("   - %s_encoder.pkl", model_name)
+            logger.info("   - %s_metadata.pkl", model_name)
 
             return True
 
         except Exception as e:
-            print(f"❌ Error guardando modelo: {e}")
+            logger.error("Error guardando modelo: %s", e)
             return False
     
     def load_model(self, model_name='cv_classifier'):
@@ -295,15 +489,20 @@ class CVClassifier:
             encoder_path = os.path.join(self.model_dir, f'{model_name}_encoder.pkl')
             self.label_encoder = joblib.load(encoder_path)
             
+            # Cargar transformador de características si el modelo es híbrido
+            features_path = os.path.join(self.model_dir, f'{model_name}_features.pkl')
+            self.feature_transformer = (joblib.load(features_path)
+                                        if os.path.exists(features_path) else None)
+            
             self.is_trained = True
             
-            print(f"✅ Modelo cargado desde {self.model_dir}/")
-            print(f"   Profesiones disponibles: {list(self.label_encoder.classes_)}")
+            logger.info("Modelo cargado desde %s/", self.model_dir)
+            logger.info("   Profesiones disponibles: %s", list(self.label_encoder.classes_))
             
             return True
             
         except Exception as e:
-            print(f"❌ Error cargando modelo: {e}")
+            logger.error("Error cargando modelo: %s", e)
             return False
     
     def get_model_info(self):
@@ -329,6 +528,7 @@ class CVClassifier:
             'professions': list(self.label_encoder.classes_),
             'num_professions': len(self.label_encoder.classes_),
             'num_features': self.vectorizer.max_features if self.vectorizer else 0,
+            'feature_mode': 'hybrid' if self.feature_transformer else 'tfidf',
             'model_type': model_type_name
         }
 
@@ -371,7 +571,7 @@ class CVClassifier:
                             })
 
                     except Exception as e:
-                        print(f"Error leyendo metadatos de {model_name}: {e}")
+                        logger.warning("Error leyendo metadatos de %s: %s", model_name, e)
                         continue
 
         # Modelos de Deep Learning
@@ -401,7 +601,7 @@ class CVClassifier:
                             })
 
                     except Exception as e:
-                        print(f"Error leyendo metadatos DL de {model_name}: {e}")
+                        logger.warning("Error leyendo metadatos DL de %s: %s", model_name, e)
                         continue
 
         return sorted(models, key=lambda x: x['creation_date'], reverse=True)
@@ -453,7 +653,8 @@ class CVClassifier:
                     f'{model_name}_vectorizer.pkl',
                     f'{model_name}_classifier.pkl',
                     f'{model_name}_encoder.pkl',
-                    f'{model_name}_metadata.pkl'
+                    f'{model_name}_metadata.pkl',
+                    f'{model_name}_features.pkl'
                 ]
 
                 for file in files_to_delete:
@@ -464,13 +665,13 @@ class CVClassifier:
 
             if deleted_files:
                 model_type = "Deep Learning" if is_deep_learning else "tradicional"
-                print(f"✅ Modelo {model_type} '{model_name}' eliminado")
-                print(f"   Archivos eliminados: {len(deleted_files)}")
+                logger.info("Modelo %s '%s' eliminado", model_type, model_name)
+                logger.info("   Archivos eliminados: %s", len(deleted_files))
                 return True
             else:
-                print(f"⚠️ No se encontraron archivos para el modelo '{model_name}'")
+                logger.warning("No se encontraron archivos para el modelo '%s'", model_name)
                 return False
 
         except Exception as e:
-            print(f"❌ Error eliminando modelo '{model_name}': {e}")
+            logger.error("Error eliminando modelo '%s': %s", model_name, e)
             return False
@@ -3,6 +3,7 @@ Clasificador de CVs usando modelos de Deep Learning
 Incluye LSTM, BERT y CNN para texto
 """
 
+import logging
 import os
 import pandas as pd
 import numpy as np
@@ -11,8 +12,14 @@ from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
 import warnings
+
+from ..utils.corpus_store import CorpusStore
+from ..utils.dedup import NearDuplicateFilter
+
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
 # Verificar disponibilidad de librerías de deep learning
 try:
     import tensorflow as tf
@@ -23,19 +30,19 @@ try:
     from tensorflow.keras.utils import to_categorical
     from tensorflow.keras.callbacks import EarlyStopping
     TENSORFLOW_AVAILABLE = True
-    print("✅ TensorFlow disponible")
+    logger.debug("TensorFlow disponible")
 except ImportError:
     TENSORFLOW_AVAILABLE = False
-    print("❌ TensorFlow no disponible")
+    logger.warning("TensorFlow no disponible")
 
 try:
     from transformers import AutoTokenizer, TFAutoModel
     import transformers
     TRANSFORMERS_AVAILABLE = True
-    print("✅ Transformers disponible")
+    logger.debug("Transformers disponible")
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
-    print("❌ Transformers no disponible")
+    logger.warning("Transformers no disponible")
 
 class DeepLearningClassifier:
     """Clasificador de CVs usando modelos de Deep Learning"""
@@ -179,21 +186,41 @@ class DeepLearningClassifier:
         
         return model
     
-    def train_model(self, data, model_type='lstm', epochs=10, batch_size=32):
-        """Entrena el modelo de deep learning"""
+    def train_model(self, data, model_type='lstm', epochs=10, batch_size=32,
+                    dedup_threshold=None):
+        """Entrena el modelo de deep learning
+        
+        Con dedup_threshold se descartan antes los CVs casi duplicados.
+        """
         try:
             # Verificar dependencias
             self.check_dependencies(model_type)
             
-            print(f"=== INICIANDO ENTRENAMIENTO DEEP LEARNING ===")
-            print(f"Modelo: {model_type.upper()}")
-            
-            # Preparar datos
-            texts = [item['text'] for item in data]
-            labels = [item['profession'] for item in data]
-            
-            print(f"Datos preparados: {len(texts)} CVs, {len(set(labels))} profesiones")
-            print(f"Profesiones: {set(labels)}")
+            logger.info("=== INICIANDO ENTRENAMIENTO DEEP LEARNING ===")
+            logger.info("Modelo: %s", model_type.upper())
+            
+            # Preparar datos (data puede ser un generador, se recorre una vez,
+            # o un CorpusStore del que solo se leen texto y profesión)
+            if isinstance(data, CorpusStore):
+                data = data.iter_results(columns=('file_name', 'profession', 'text', 'status'))
+            dedup = None
+            if dedup_threshold:
+                dedup = NearDuplicateFilter(threshold=dedup_threshold)
+                data = dedup.filter(data)
+            texts = []
+            labels = []
+            for item in data:
+                if item.get('status', 'success') == 'success':
+                    texts.append(item['text'])
+                    labels.append(item['profession'])
+            
+            if not texts:
+                raise ValueError("No hay CVs procesados exitosamente")
+            
+            logger.info("Datos preparados: %s CVs, %s profesiones", len(texts), len(set(labels)))
+            logger.info("Profesiones: %s", set(labels))
+            if dedup is not None:
+                logger.info("Casi duplicados descartados: %s", len(dedup.duplicates))
             
             # Preparar datos según el tipo de modelo
             if model_type == 'bert':
@@ -216,7 +243,7 @@ class DeepLearningClassifier:
                 )
             
             # Crear modelo
-            print(f"Creando modelo {model_type.upper()}...")
+            logger.info("Creando modelo %s...", model_type.upper())
             if model_type == 'lstm':
                 self.model = self.create_lstm_model(num_classes)
             elif model_type == 'cnn':
@@ -236,7 +263,7 @@ class DeepLearningClassifier:
             )
             
             # Entrenar modelo
-            print(f"Entrenando modelo...")
+            logger.info("Entrenando modelo...")
             history = self.model.fit(
                 X_train, y_train,
                 validation_data=(X_test, y_test),
@@ -247,16 +274,16 @@ class DeepLearningClassifier:
             )
             
             # Evaluar modelo
-            print(f"Evaluando modelo...")
+            logger.info("Evaluando modelo...")
             y_pred = self.model.predict(X_test)
             y_pred_classes = np.argmax(y_pred, axis=1)
             y_test_classes = np.argmax(y_test, axis=1)
             
             accuracy = accuracy_score(y_test_classes, y_pred_classes)
             
-            print(f"\n=== RESULTADOS DEL ENTRENAMIENTO ===")
-            print(f"Precisión: {accuracy:.3f}")
-            print(f"Épocas entrenadas: {len(history.history['loss'])}")
+            logger.info("=== RESULTADOS DEL ENTRENAMIENTO ===")
+            logger.info("Precisión: %.3f", accuracy)
+            logger.info("Épocas entrenadas: %s", len(history.history['loss']))
             
             # Reporte detallado
             report = classification_report(
@@ -264,8 +291,7 @@ class DeepLearningClassifier:
                 target_names=self.label_encoder.classes_,
                 zero_division=0
             )
-            print(f"\nReporte de clasificación:")
-            print(report)
+            logger.debug("Reporte de clasificación:\n%s", report)
             
             self.is_trained = True
             
@@ -275,11 +301,12 @@ class DeepLearningClassifier:
                 'model_type': model_type,
                 'epochs_trained': len(history.history['loss']),
                 'num_classes': num_classes,
+                'duplicates_removed': len(dedup.duplicates) if dedup is not None else 0,
                 'history': history.history
             }
             
         except Exception as e:
-            print(f"❌ Error durante el entrenamiento: {e}")
+            logger.error("Error durante el entrenamiento: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -385,11 +412,11 @@ class DeepLearningClassifier:
             metadata_path = os.path.join(self.model_dir, f'{model_name}_metadata.pkl')
             joblib.dump(metadata, metadata_path)
             
-            print(f"✅ Modelo Deep Learning '{model_name}' guardado en {self.model_dir}/")
+            logger.info("Modelo Deep Learning '%s' guardado en %s/", model_name, self.model_dir)
             return True
             
         except Exception as e:
-            print(f"❌ Error guardando modelo: {e}")
+            logger.error("Error guardando modelo: %s", e)
             return False
     
     def load_model(self, model_name='deep_cv_classifier'):
@@ -427,9 +454,9 @@ class DeepLearningClassifier:
             self.vocab_size = metadata.get('vocab_size', 10000)
             
             self.is_trained = True
-            print(f"✅ Modelo Deep Learning '{model_name}' cargado exitosamente")
+            logger.info("Modelo Deep Learning '%s' cargado exitosamente", model_name)
             return True
             
         except Exception as e:
-            print(f"❌ Error cargando modelo: {e}")
+            logger.error("Error cargando modelo: %s", e)
             return False
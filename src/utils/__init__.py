@@ -3,5 +3,22 @@ Utilidades y procesadores
 """
 
 from .cv_processor import CVProcessor
+from .extraction_cache import ExtractionCache
+from .ocr_engine import OCREngine
+from .keyword_matcher import KeywordMatcher
+from .skill_taxonomy import SkillTaxonomy
+from .feature_table import FeatureTableBuilder
+from .watchdog import IsolatedExecutor
+from .corpus_scanner import CorpusScanner
+from .corpus_store import CorpusStore
+from .dedup import NearDuplicateFilter
+from .async_processor import AsyncCVProcessor
+from .metrics import PipelineMetrics
+from .logging_utils import ProgressReporter, configure_logging
 
-__all__ = ['CVProcessor']
+__all__ = [
+    'CVProcessor', 'ExtractionCache', 'OCREngine', 'KeywordMatcher',
+    'SkillTaxonomy', 'FeatureTableBuilder', 'IsolatedExecutor', 'CorpusScanner',
+    'CorpusStore', 'NearDuplicateFilter', 'AsyncCVProcessor',
+    'PipelineMetrics', 'ProgressReporter', 'configure_logging'
+]
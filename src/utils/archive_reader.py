@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura en streaming de los CVs contenidos en archivos zip y tar
+"""
+
+import os
+import tarfile
+import zipfile
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path):
+    """Indica si la ruta es un zip o tar (por extensión)"""
+    return os.path.isfile(path) and path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _is_supported(member_name, supported_formats):
+    base_name = os.path.basename(member_name)
+    # Metadatos de macOS (__MACOSX/, ._archivo) y ocultos
+    if not base_name or base_name.startswith('.') or member_name.startswith('__MACOSX/'):
+        return False
+    return os.path.splitext(base_name.lower())[1] in supported_formats
+
+
+def iter_archive_members(archive_path, supported_formats, max_member_bytes=None):
+    """Genera (nombre del miembro, bytes) de los archivos soportados, uno a uno
+
+    Solo se mantiene en memoria el miembro actual; los tar se leen en modo
+    secuencial (también comprimidos) sin descomprimir a disco. Los miembros
+    mayores que max_member_bytes se generan con bytes None para que el
+    llamador los reporte sin leerlos.
+    """
+    supported_formats = {ext.lower() for ext in supported_formats}
+
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not _is_supported(info.filename, supported_formats):
+                    continue
+                if max_member_bytes is not None and info.file_size > max_member_bytes:
+                    yield info.filename, None
+                    continue
+                yield info.filename, archive.read(info)
+        return
+
+    # 'r|*': lectura secuencial en streaming con detección de compresión
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for member in archive:
+            if not member.isfile() or not _is_supported(member.name, supported_formats):
+                continue
+            if max_member_bytes is not None and member.size > max_member_bytes:
+                yield member.name, None
+                continue
+            stream = archive.extractfile(member)
+            yield member.name, stream.read()
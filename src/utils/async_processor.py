@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+API asíncrona del procesador de CVs para servicios basados en asyncio
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .cv_processor import (CVProcessor, _init_pool_worker, _pool_process_bytes,
+                           _pool_process_file)
+from .watchdog import IsolatedExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCVProcessor:
+    """Envoltorio asíncrono de CVProcessor
+
+    La extracción (PDF, DOCX, OCR) se ejecuta en un pool de procesos
+    acotado, de modo que el event loop nunca se bloquea en Tesseract. Un
+    semáforo limita los CVs en curso (contrapresión) y cancelar una tarea
+    libera su lugar; un CV que ya empezó a procesarse en un worker termina
+    allí y su resultado se descarta.
+
+    Si un worker muere (un fallo nativo de PyPDF2, cv2 o Tesseract) el
+    pool se reemplaza y los CVs que estaban en él se repiten uno a uno en
+    un proceso vigilado: solo el culpable se reporta como 'crashed'.
+
+    Uso:
+        async with AsyncCVProcessor(processor, max_workers=4) as service:
+            result = await service.extract('cv.pdf')
+            async for result in service.extract_many(paths):
+                ...
+    """
+
+    def __init__(self, processor=None, max_workers=None, max_concurrency=None):
+        self.processor = processor if processor is not None else CVProcessor()
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.max_concurrency = max(1, max_concurrency or 2 * self.max_workers)
+        self._executor = None
+        self._semaphore = None
+
+    @property
+    def executor(self):
+        """Pool de procesos creado bajo demanda"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=_init_pool_worker,
+                                                 initargs=(self.processor,))
+        return self._executor
+
+    @property
+    def semaphore(self):
+        """Semáforo de contrapresión (se crea dentro del event loop)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def extract(self, source, profession_name=None, name=None):
+        """Procesa un CV y retorna el mismo dict que process_cv_file
+
+        source es una ruta o los bytes del archivo; con bytes, name (por
+        ejemplo 'cv.pdf') indica el formato.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            if not name:
+                raise ValueError("Se necesita name para procesar bytes")
+            func, args = _pool_process_bytes, (name, bytes(source), profession_name)
+            method, file_name = self.processor.process_cv_bytes, name
+        else:
+            func, args = _pool_process_file, (os.fspath(source), profession_name)
+            method, file_name = self.processor.process_cv_file, os.path.basename(args[0])
+
+        async with self.semaphore:
+            loop = asyncio.get_running_loop()
+            executor = self.executor
+            try:
+                result = await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                result = await loop.run_in_executor(
+                    None, self._process_isolated, method, args, file_name, profession_name
+                )
+        self.processor._record_cache_result(result)
+        self.processor.metrics.add_result(result)
+        return result
+
+    def _discard_executor(self, executor):
+        """Descarta un pool roto; el siguiente CV crea uno nuevo"""
+        if self._executor is executor:
+            logger.warning("Un worker terminó abruptamente; se reemplaza el pool")
+            self._executor = None
+            executor.shutdown(wait=False)
+
+    def _process_isolated(self, method, args, file_name, profession_name):
+        """Repite un CV en un proceso vigilado y retorna su resultado o el del fallo"""
+        [(status, payload)] = IsolatedExecutor(method).map([args])
+        if status == 'ok':
+            return payload
+        return self.processor._failed_result(file_name, profession_name, status, payload)
+
+    async def extract_many(self, sources, profession_name=None):
+        """Genera los resultados en el orden de entrada
+
+        sources puede ser un iterable o un iterable asíncrono de rutas o de
+        tuplas (nombre, bytes). Como máximo hay max_concurrency CVs en
+        curso; si el consumidor deja de iterar, los pendientes se cancelan.
+        """
+        async def iterate():
+            if hasattr(sources, '__aiter__'):
+                async for source in sources:
+                    yield source
+            else:
+                for source in sources:
+                    yield source
+
+        self.processor.metrics.start_run()
+        tasks = deque()
+        try:
+            async for source in iterate():
+                if isinstance(source, tuple):
+                    name, data = source
+                    coroutine = self.extract(data, profession_name, name=name)
+                else:
+                    coroutine = self.extract(source, profession_name)
+                tasks.append(asyncio.ensure_future(coroutine))
+                if len(tasks) >= self.max_concurrency:
+                    yield await tasks.popleft()
+            while tasks:
+                yield await tasks.popleft()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aclose(self):
+        """Cierra el pool de procesos sin bloquear el event loop"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.aclose()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Escaneo recursivo e incremental del corpus con manifiesto persistente
+"""
+
+import json
+import logging
+import os
+
+from .extraction_cache import hash_file
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def relative_name(path, root):
+    """Nombre de un archivo relativo a la raíz del escaneo, con separador '/'
+
+    Es el file_name de los resultados de una carpeta: dos 'cv.pdf' en
+    subcarpetas distintas no colisionan en el CorpusStore.
+    """
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+
+class CorpusScanner:
+    """Recorre una carpeta con os.scandir y detecta los cambios entre escaneos
+
+    El manifiesto (JSON) guarda por ruta relativa el tamaño, el mtime y el
+    hash del contenido. Un reescaneo solo calcula el hash de los archivos
+    cuyo tamaño o mtime cambió, de modo que su costo es proporcional a los
+    cambios y no al tamaño del corpus.
+    """
+
+    def __init__(self, root, supported_formats, manifest_path=None):
+        self.root = os.path.abspath(root)
+        self.supported_formats = {ext.lower() for ext in supported_formats}
+        self.manifest_path = str(manifest_path) if manifest_path else None
+        self.manifest = self._load_manifest()
+        self._pending = None
+
+    def _load_manifest(self):
+        """Lee el manifiesto guardado; uno ilegible equivale a un corpus nuevo"""
+        if not self.manifest_path or not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Manifiesto %s ilegible, se reconstruye: %s", self.manifest_path, e)
+            return {}
+        if data.get('version') != MANIFEST_VERSION or data.get('root') != self.root:
+            return {}
+        return data.get('files', {})
+
+    def iter_files(self):
+        """Genera (ruta relativa, os.stat_result) de los archivos soportados
+
+        El recorrido es recursivo y en orden estable; no sigue enlaces
+        simbólicos a directorios.
+        """
+        stack = ['']
+        while stack:
+            relative_dir = stack.pop()
+            directory = os.path.join(self.root, relative_dir)
+            try:
+                with os.scandir(directory) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning("No se pudo leer %s: %s", directory, e)
+                continue
+
+            subdirs = []
+            for entry in entries:
+                relative_path = os.path.join(relative_dir, entry.name)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(relative_path)
+                    elif (entry.is_file()
+                          and os.path.splitext(entry.name.lower())[1] in self.supported_formats):
+                        yield relative_path, entry.stat()
+                except OSError:
+                    continue
+            # Invertidos para visitar los subdirectorios en orden alfabético
+            stack.extend(reversed(subdirs))
+
+    def scan(self):
+        """Compara el disco con el manifiesto y retorna los cambios
+
+        Retorna {'added', 'changed', 'removed'} con rutas absolutas
+        ordenadas y 'unchanged' con el número de archivos sin cambios. El
+        manifiesto no se actualiza hasta llamar a save(), de modo que si el
+        procesamiento del delta falla, el siguiente escaneo lo repite.
+        """
+        previous = self.manifest
+        current = {}
+        delta = {'added': [], 'changed': [], 'removed': [], 'unchanged': 0}
+
+        for relative_path, stat in self.iter_files():
+            old = previous.get(relative_path)
+            entry = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+            if old and old['size'] == entry['size'] and old['mtime'] == entry['mtime']:
+                current[relative_path] = old
+                delta['unchanged'] += 1
+                continue
+
+            absolute_path = os.path.join(self.root, relative_path)
+            try:
+                entry['hash'] = hash_file(absolute_path)
+            except OSError as e:
+                logger.warning("Error leyendo %s: %s", absolute_path, e)
+                continue
+            current[relative_path] = entry
+
+            if old is None:
+                delta['added'].append(absolute_path)
+            elif old.get('hash') != entry['hash']:
+                delta['changed'].append(absolute_path)
+            else:
+                # Solo cambió el mtime (copia, touch): el contenido es el mismo
+                delta['unchanged'] += 1
+
+        delta['removed'] = sorted(os.path.join(self.root, relative_path)
+                                  for relative_path in previous.keys() - current.keys())
+        self._pending = current
+        return delta
+
+    def save(self):
+        """Guarda en el manifiesto el resultado del último scan()"""
+        if self._pending is not None:
+            self.manifest = self._pending
+            self._pending = None
+        if not self.manifest_path:
+            return
+
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Escritura atómica: un corte a mitad no deja el manifiesto corrupto
+        temp_path = self.manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': MANIFEST_VERSION, 'root': self.root, 'files': self.manifest},
+                      file, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+
+    def relative_names(self, paths):
+        """file_name de los resultados para rutas absolutas de un scan()
+
+        Por ejemplo, para borrar del CorpusStore los archivos eliminados:
+        store.delete(profession, scanner.relative_names(delta['removed'])).
+        """
+        return [relative_name(path, self.root) for path in paths]
+
+    def list_files(self):
+        """Rutas absolutas de todos los archivos soportados, en orden estable"""
+        return [os.path.join(self.root, relative_path) for relative_path, _ in self.iter_files()]
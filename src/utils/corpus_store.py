@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Almacén persistente del corpus extraído (texto limpio, características y estado)
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+# Columnas que se pueden proyectar al cargar
+COLUMNS = ('file_name', 'profession', 'text', 'features', 'status', 'error')
+
+
+class CorpusStore:
+    """Tabla SQLite con un resultado de process_cv_file por (profesión, archivo)
+
+    Permite añadir (append) o reemplazar (upsert) resultados y cargar luego
+    un conjunto de entrenamiento leyendo solo las columnas necesarias, sin
+    volver a extraer los documentos.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        self._conn = None
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __getstate__(self):
+        # La conexión SQLite no se puede serializar hacia otros procesos
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        return state
+
+    @property
+    def conn(self):
+        """Conexión perezosa (una por proceso)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS corpus (
+                    profession TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    features TEXT NOT NULL,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (profession, file_name)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_corpus_status ON corpus (status)")
+        return self._conn
+
+    def _rows(self, results):
+        now = time.time()
+        for result in results:
+            yield (result['profession'], result['file_name'], result.get('status', 'error'),
+                   result.get('text') or '', json.dumps(result.get('features') or {}),
+                   result.get('error'), now)
+
+    def _write(self, verb, results):
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"INSERT OR {verb} INTO corpus "
+                "(profession, file_name, status, text, features, error, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._rows(results)
+            )
+        return cursor.rowcount
+
+    def upsert(self, results):
+        """Guarda los resultados reemplazando los existentes; retorna cuántos"""
+        return self._write('REPLACE', results)
+
+    def append(self, results):
+        """Guarda solo los resultados que aún no existen; retorna cuántos"""
+        return self._write('IGNORE', results)
+
+    def write_through(self, results, batch_size=500):
+        """Genera los resultados tal cual mientras los guarda por lotes (upsert)"""
+        batch = []
+        for result in results:
+            batch.append(result)
+            if len(batch) >= batch_size:
+                self.upsert(batch)
+                batch = []
+            yield result
+        if batch:
+            self.upsert(batch)
+
+    def delete(self, profession, file_names):
+        """Elimina archivos de una profesión por su file_name
+
+        Las rutas de un escaneo son absolutas: para el 'removed' de un
+        CorpusScanner se pasa scanner.relative_names(delta['removed']).
+        """
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM corpus WHERE profession = ? AND file_name = ?",
+                ((profession, file_name) for file_name in file_names)
+            )
+
+    def iter_results(self, columns=('profession', 'text', 'status'), status='success',
+                     professions=None):
+        """Genera dicts con solo las columnas pedidas
+
+        Por defecto carga lo necesario para entrenar con TF-IDF; añadir
+        'features' solo cuando se usan las características extraídas,
+        ya que es la columna más costosa de decodificar.
+        """
+        columns = list(columns)
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Columnas desconocidas: {sorted(unknown)}")
+
+        query = f"SELECT {', '.join(columns)} FROM corpus"
+        conditions = []
+        params = []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if professions is not None:
+            professions = list(professions)
+            conditions.append(f"profession IN ({', '.join('?' * len(professions))})")
+            params.extend(professions)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY profession, file_name"
+
+        decode_features = 'features' in columns
+        for row in self.conn.execute(query, params):
+            result = dict(zip(columns, row))
+            if decode_features:
+                result['features'] = json.loads(result['features'])
+            yield result
+
+    def count(self, status=None):
+        """Número de resultados guardados (opcionalmente por estado)"""
+        if status is None:
+            row = self.conn.execute("SELECT COUNT(*) FROM corpus").fetchone()
+        else:
+            row = self.conn.execute("SELECT COUNT(*) FROM corpus WHERE status = ?",
+                                    (status,)).fetchone()
+        return row[0]
+
+    def get_stats(self):
+        """Resultados guardados por profesión y estado"""
+        stats = {}
+        for profession, status, total in self.conn.execute(
+                "SELECT profession, status, COUNT(*) FROM corpus GROUP BY profession, status"):
+            stats.setdefault(profession, {})[status] = total
+        return stats
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
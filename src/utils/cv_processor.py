@@ -3,113 +3,595 @@
 Procesador de CVs simplificado para clasificación por profesiones
 """
 
+import functools
+import io
+import logging
+import multiprocessing
 import os
 import re
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import PyPDF2
-import pytesseract
 from docx import Document
 import cv2
 import numpy as np
 from PIL import Image
 import pandas as pd
 
+from .ocr_engine import OCREngine
+from . import docx_fast, language, pdf_tools, preflight, text_normalization
+from .skill_taxonomy import get_default_taxonomy
+from .feature_table import FeatureTableBuilder
+from .watchdog import IsolatedExecutor
+from .corpus_scanner import CorpusScanner, relative_name
+from . import archive_reader
+from .metrics import PipelineMetrics
+from .logging_utils import ProgressReporter
+
+logger = logging.getLogger(__name__)
+
+# Patrones de limpieza de texto, compilados una sola vez
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.\@\-\+\(\),;:]')
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'[\+]?[\d\s\-\(\)]{8,15}')
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\s*años?\s*de\s*experiencia', re.IGNORECASE),
+    re.compile(r'experiencia\s*de\s*(\d+)\s*años?', re.IGNORECASE),
+    re.compile(r'(\d+)\s*years?\s*of\s*experience', re.IGNORECASE)
+]
+
+# Lectura reducida de imágenes grandes (la decodificación ya produce menos píxeles)
+IMREAD_REDUCED_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8
+}
+
+
+
+# Procesador de cada worker del pool, enviado una sola vez por el initializer
+_pool_processor = None
+
+
+def _init_pool_worker(processor):
+    global _pool_processor
+    _pool_processor = processor
+
+
+def _pool_process_file(file_path, profession_name):
+    return _pool_processor.process_cv_file(file_path, profession_name)
+
+
+def _pool_process_bytes(file_name, data, profession_name):
+    return _pool_processor.process_cv_bytes(file_name, data, profession_name)
+
+
+def _pool_process_files(file_paths, profession_name, root=None):
+    return _pool_processor.process_cv_files(file_paths, profession_name, root)
+
+
+def _pool_process_members(tasks):
+    return _pool_processor.process_archive_members(tasks)
+
+
+_rasterizer_warned = False
+
+
+def _warn_no_rasterizer():
+    """Avisa una vez por proceso de que las páginas escaneadas no pueden pasar por OCR"""
+    global _rasterizer_warned
+    if not _rasterizer_warned:
+        _rasterizer_warned = True
+        logger.warning("Hay páginas PDF escaneadas pero no hay rasterizador instalado "
+                       "(pip install pypdfium2); se omite su OCR")
+
+
+def _chunked(iterable, size):
+    """Agrupa un iterable (posiblemente perezoso) en listas de size elementos"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _is_path(source):
+    """Indica si source es una ruta (y no un buffer en memoria)"""
+    return isinstance(source, (str, os.PathLike))
+
+
+def _rewind(source):
+    """Rebobina un buffer en memoria antes de pasarlo a otro lector"""
+    if not _is_path(source):
+        source.seek(0)
+    return source
+
+
+@contextmanager
+def _open_binary(source):
+    """Abre una ruta en binario o entrega el buffer en memoria rebobinado"""
+    if _is_path(source):
+        with open(source, 'rb') as file:
+            yield file
+    else:
+        yield _rewind(source)
+
+# Detalles de la extracción que se guardan en la caché junto al texto
+CACHED_INFO_KEYS = ('truncated', 'pages', 'ocr_pages', 'ocr_skipped_pages', 'encoding')
+
+# Formatos cuyo texto puede venir del OCR (su clave de caché incluye la configuración OCR)
+OCR_FORMATS = ('.pdf', '.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+
+# Franja central de la imagen (fracción del alto) que se lee para elegir el idioma
+OCR_PROBE_FRACTION = 0.2
+
 class CVProcessor:
     """Procesador simplificado de CVs"""
     
-    def __init__(self):
-        self.supported_formats = ['.pdf', '.docx', '.doc', '.jpg', '.jpeg', '.png', '.bmp', '.tiff']
+    def __init__(self, cache=None, ocr_engine=None, pdf_ocr_dpi=200, pdf_max_ocr_pages=10,
+                 pdf_page_workers=1, pdf_parallel_min_pages=20, extraction_budget=None,
+                 taxonomy=None, fold_accents=False, normalize_unicode=False,
+                 max_file_size_mb=None, max_image_pixels=None, ocr_auto_language=False,
+                 progress_every_n=500, progress_every_s=5.0):
+        self.supported_formats = ['.pdf', '.docx', '.doc', '.txt',
+                                  '.jpg', '.jpeg', '.png', '.bmp', '.tiff']
+        # Caché opcional de extracción (ExtractionCache)
+        self.cache = cache
+        # Motor OCR compartido por todas las imágenes (se crea bajo demanda)
+        self._ocr_engine = ocr_engine
+        # OCR de páginas PDF sin capa de texto
+        self.pdf_ocr_dpi = pdf_ocr_dpi
+        self.pdf_max_ocr_pages = pdf_max_ocr_pages
+        # Extracción paralela por rangos de páginas para PDFs grandes
+        # (conviene dejar pdf_page_workers=1 si ya se usan workers por archivo)
+        self.pdf_page_workers = pdf_page_workers
+        self.pdf_parallel_min_pages = pdf_parallel_min_pages
+        # Presupuesto de extracción por defecto para process_cv_file:
+        # dict con max_chars, max_pages y/o max_ocr_pages (None = sin límite)
+        self.extraction_budget = extraction_budget
+        # Taxonomía de habilidades/educación (SkillTaxonomy, recargable)
+        self._taxonomy = taxonomy
+        # Normalización opcional en clean_text
+        self.fold_accents = fold_accents
+        self.normalize_unicode = normalize_unicode
+        # Inspección previa: documentos grandes se truncan o se omiten e
+        # imágenes grandes se decodifican reducidas (None = sin límite)
+        self.max_file_size_mb = max_file_size_mb
+        self.max_image_pixels = max_image_pixels
+        # Elegir por imagen el paquete de Tesseract (spa, eng o spa+eng)
+        self.ocr_auto_language = ocr_auto_language
+        # Tiempos por etapa y formato de los resultados procesados
+        self.metrics = PipelineMetrics()
+        # Progreso agregado en el log: cada N archivos o T segundos
+        self.progress_every_n = progress_every_n
+        self.progress_every_s = progress_every_s
+    
+    def __getstate__(self):
+        # Las métricas crecen con cada resultado y solo se agregan en el
+        # proceso principal; los workers empiezan con unas vacías
+        state = self.__dict__.copy()
+        state['metrics'] = PipelineMetrics()
+        return state
+    
+    @property
+    def taxonomy(self):
+        """Taxonomía de habilidades usada por extract_features"""
+        if self._taxonomy is None:
+            self._taxonomy = get_default_taxonomy()
+        return self._taxonomy
+    
+    @property
+    def ocr_engine(self):
+        """Motor OCR con workers persistentes"""
+        if self._ocr_engine is None:
+            self._ocr_engine = OCREngine()
+        return self._ocr_engine
+    
+    def extract_text_from_file(self, file_path, max_chars=None, max_pages=None,
+                               max_ocr_pages=None, info=None):
+        """Extrae texto de un archivo según su formato
+        
+        Los límites opcionales detienen la extracción en cuanto se alcanzan
+        (caracteres, páginas leídas o páginas con OCR); si se pasa un dict
+        info, en él queda info['truncated'] = True cuando se aplicó alguno.
+        
+        Pasa por la misma inspección previa que process_cv_file: los
+        archivos demasiado grandes retornan "" sin abrirse y los grandes
+        se leen con el presupuesto reducido.
+        """
+        if info is None:
+            info = {}
+        plan = self.preflight(file_path)
+        if plan['action'] != 'full':
+            info['preflight'] = plan
+        if plan['action'] == 'skip':
+            logger.warning("Se omite %s: %s", file_path, plan['reason'])
+            return ""
+        
+        budget = self._budget_for(plan)
+        limits = {'max_chars': max_chars, 'max_pages': max_pages, 'max_ocr_pages': max_ocr_pages}
+        for key, limit in limits.items():
+            if limit is not None and (budget.get(key) is None or budget[key] > limit):
+                budget[key] = limit
+        return self.extract_and_clean(file_path, info, budget)[0]
+    
+    def extract_and_clean(self, file_path, info=None, budget=None, name=None):
+        """Retorna (texto crudo, texto limpio, acierto de caché)
+        
+        Con caché configurada solo se extrae de nuevo cuando el contenido
+        del archivo (o la versión del extractor) ha cambiado. Si se pasa
+        un dict info, los extractores registran en él detalles de la
+        extracción (páginas, páginas con OCR, truncado, etc.) y los segundos
+        de cada etapa en info['timings'] ('cache' es el hash y la consulta;
+        'parse' incluye la lectura del archivo, que hacen los extractores).
+        
+        file_path puede ser también un buffer en memoria (io.BytesIO), por
+        ejemplo un miembro de un zip; el formato se toma entonces de name.
+        """
+        if info is None:
+            info = {}
+        budget = {k: v for k, v in (budget or {}).items() if v is not None}
+        timings = info.setdefault('timings', {})
+        
+        # Leer un .txt cuesta menos que calcular su hash: no pasa por la caché
+        if self.cache is None or (name or file_path).lower().endswith('.txt'):
+            # Acierto de caché None: la caché no se consultó
+            return self._extract_and_clean_timed(file_path, info, budget, name) + (None,)
+        
+        start = time.perf_counter()
+        try:
+            key = self._cache_key(file_path, budget, name)
+        except OSError as e:
+            logger.warning("Error leyendo %s: %s", name or file_path, e)
+            return "", "", False
+        
+        cached = self.cache.get(key)
+        timings['cache'] = time.perf_counter() - start
+        if cached is not None:
+            raw_text, clean_text, cached_info = cached
+            info.update(cached_info)
+            return raw_text, clean_text, True
+        
+        raw_text, clean_text = self._extract_and_clean_timed(file_path, info, budget, name)
+        if raw_text:
+            self.cache.put(key, raw_text, clean_text,
+                           {k: info[k] for k in CACHED_INFO_KEYS if k in info})
+        return raw_text, clean_text, False
+    
+    def _extract_and_clean_timed(self, file_path, info, budget, name):
+        """Extrae y limpia registrando las etapas 'parse' y 'clean'"""
+        timings = info['timings']
+        start = time.perf_counter()
+        raw_text = self._extract_within_budget(file_path, info, budget, name)
+        parsed = time.perf_counter()
+        clean_text = self.clean_text(raw_text)
+        timings['parse'] = parsed - start
+        timings['clean'] = time.perf_counter() - parsed
+        return raw_text, clean_text
     
-    def extract_text_from_file(self, file_path):
-        """Extrae texto de un archivo según su formato"""
+    def _cache_key(self, file_path, budget, name=None):
+        """Clave de caché: hash del contenido más el presupuesto aplicado"""
+        key = self.cache.make_key(file_path)
+        # El texto limpio guardado depende de las opciones de normalización
+        if self.fold_accents or self.normalize_unicode:
+            key += f"|fold={int(self.fold_accents)},nfkc={int(self.normalize_unicode)}"
+        # y, en PDFs e imágenes, de la configuración del OCR
+        if os.path.splitext((name or file_path).lower())[1] in OCR_FORMATS:
+            engine = self.ocr_engine
+            key += (f"|ocr={engine.lang},psm={engine.psm},oem={engine.oem},"
+                    f"auto={int(self.ocr_auto_language)},dpi={self.pdf_ocr_dpi},"
+                    f"pages={self.pdf_max_ocr_pages}")
+        if budget:
+            key += '|' + ','.join(f"{k}={budget[k]}" for k in sorted(budget))
+        return key
+    
+    def _extract_within_budget(self, file_path, info, budget, name=None):
+        """Extrae el texto y lo recorta a max_chars si corresponde"""
+        raw_text = self._extract_uncached(file_path, info, budget, name)
+        max_chars = budget.get('max_chars')
+        if max_chars is not None and len(raw_text) > max_chars:
+            raw_text = raw_text[:max_chars]
+            info['truncated'] = True
+        return raw_text
+    
+    def _extract_uncached(self, file_path, info=None, budget=None, name=None):
+        """Extrae texto de un archivo (o buffer) sin consultar la caché"""
+        if info is None:
+            info = {}
+        budget = budget or {}
+        name = name or file_path
         try:
-            file_ext = os.path.splitext(file_path.lower())[1]
+            file_ext = os.path.splitext(name.lower())[1]
             
-            if file_ext == '.pdf':
-                return self._extract_from_pdf(file_path)
+            if file_ext == '.txt':
+                return self._extract_from_text(file_path, info, budget)
+            elif file_ext == '.pdf':
+                return self._extract_from_pdf(file_path, info, budget)
             elif file_ext in ['.docx', '.doc']:
-                return self._extract_from_word(file_path)
+                return self._extract_from_word(file_path, info, budget, name)
             elif file_ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']:
-                return self._extract_from_image(file_path)
+                if budget.get('max_ocr_pages') == 0:
+                    info['truncated'] = True
+                    return ""
+                return self._extract_from_image(file_path, budget.get('image_reduction'), info)
             else:
                 return ""
         except Exception as e:
-            print(f"Error procesando {file_path}: {e}")
+            logger.warning("Error procesando %s: %s", name, e)
             return ""
     
-    def _extract_from_pdf(self, pdf_path):
-        """Extrae texto de PDF"""
-        text = ""
+    def _extract_from_text(self, text_path, info=None, budget=None):
+        """Extrae texto plano con una sola lectura, detectando la codificación
+        
+        Con max_chars solo se lee el prefijo necesario (4 bytes por
+        carácter como máximo); nunca se recurre a OCR.
+        """
+        if info is None:
+            info = {}
+        max_chars = (budget or {}).get('max_chars')
+        size = -1 if max_chars is None else max_chars * 4 + 4
+        with _open_binary(text_path) as file:
+            data = file.read(size)
+            truncated = size != -1 and file.read(1) != b''
+        text, encoding = text_normalization.decode_text(data, final=not truncated)
+        info['encoding'] = encoding
+        return text
+    
+    def _extract_from_pdf(self, pdf_path, info=None, budget=None):
+        """Extrae texto de PDF
+        
+        Los PDFs con al menos pdf_parallel_min_pages páginas se reparten por
+        rangos de páginas entre pdf_page_workers procesos. Las páginas sin
+        capa de texto utilizable (escaneadas) se rasterizan y pasan por OCR,
+        hasta pdf_max_ocr_pages; las demás no se renderizan. Con presupuesto
+        la lectura se detiene al llegar a max_pages o a max_chars.
+        """
+        if info is None:
+            info = {}
+        budget = budget or {}
+        max_chars = budget.get('max_chars')
+        max_ocr_pages = self.pdf_max_ocr_pages
+        if budget.get('max_ocr_pages') is not None:
+            max_ocr_pages = min(max_ocr_pages, budget['max_ocr_pages'])
+        
+        page_texts = []
+        page_timings = []
         try:
-            with open(pdf_path, 'rb') as file:
+            with _open_binary(pdf_path) as file:
                 reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
+                num_pages = len(reader.pages)
+                info['pages'] = num_pages
+                info['ocr_pages'] = 0
+                
+                pages_to_read = num_pages
+                if budget.get('max_pages') is not None and budget['max_pages'] < num_pages:
+                    pages_to_read = budget['max_pages']
+                    info['truncated'] = True
+                
+                # Con límite de caracteres se lee en serie para poder parar antes;
+                # también en un worker daemon (IsolatedExecutor), que no puede crear procesos
+                if (self.pdf_page_workers > 1 and max_chars is None and _is_path(pdf_path)
+                        and pages_to_read >= self.pdf_parallel_min_pages
+                        and not multiprocessing.current_process().daemon):
+                    page_results = self._extract_pdf_pages_parallel(pdf_path, pages_to_read)
+                else:
+                    page_results = pdf_tools.iter_pages(reader, range(pages_to_read))
+                
+                num_chars = 0
+                for page_index, (page_text, seconds) in enumerate(page_results):
+                    if not pdf_tools.has_text_layer(page_text):
+                        start = time.perf_counter()
+                        page_text = self._ocr_pdf_page(pdf_path, page_index, info,
+                                                       max_ocr_pages) or page_text
+                        seconds += time.perf_counter() - start
+                    page_texts.append(page_text)
+                    page_timings.append(seconds)
+                    
+                    num_chars += len(page_text)
+                    if max_chars is not None and num_chars >= max_chars:
+                        if page_index + 1 < pages_to_read:
+                            info['truncated'] = True
+                        break
+            info['page_timings'] = page_timings
         except Exception as e:
-            print(f"Error en PDF {pdf_path}: {e}")
-        return text
+            logger.warning("Error en PDF %s: %s", pdf_path, e)
+        return "\n".join(page_texts) + "\n" if page_texts else ""
+    
+    def _extract_pdf_pages_parallel(self, pdf_path, num_pages):
+        """Extrae rangos de páginas en paralelo y los reensambla en orden"""
+        ranges = pdf_tools.split_page_ranges(num_pages, self.pdf_page_workers)
+        page_results = []
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(pdf_tools.extract_page_range, pdf_path, start, stop)
+                       for start, stop in ranges]
+            for future in futures:
+                page_results.extend(future.result())
+        return page_results
+    
+    def _ocr_pdf_page(self, pdf_path, page_index, info, max_ocr_pages):
+        """Rasteriza una página escaneada y aplica OCR"""
+        if info['ocr_pages'] >= max_ocr_pages:
+            info['ocr_skipped_pages'] = info.get('ocr_skipped_pages', 0) + 1
+            info['truncated'] = True
+            return ""
+        if not pdf_tools.can_render_pages():
+            _warn_no_rasterizer()
+            return ""
+        try:
+            image = pdf_tools.render_page(pdf_path, page_index, dpi=self.pdf_ocr_dpi)
+            if image is None:
+                return ""
+            info['ocr_pages'] += 1
+            gray = self._preprocess_image(image, cv2.COLOR_RGB2GRAY)
+            return self._recognize(gray, info)
+        except Exception as e:
+            logger.warning("Error en OCR de la página %d de %s: %s", page_index + 1, pdf_path, e)
+            return ""
+    
+    def _extract_from_word(self, word_path, info=None, budget=None, name=None):
+        """Extrae texto de documento Word
+        
+        Los .docx se leen en streaming directamente del XML; python-docx
+        queda como alternativa si el parser rápido falla.
+        """
+        if info is None:
+            info = {}
+        max_chars = (budget or {}).get('max_chars')
+        name = name or word_path
+        
+        if name.lower().endswith('.docx'):
+            try:
+                text, truncated = docx_fast.extract_docx_text(_rewind(word_path),
+                                                              max_chars=max_chars)
+                if truncated:
+                    info['truncated'] = True
+                return text
+            except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+                logger.info("Parser rápido falló en %s, usando python-docx: %s", name, e)
+        
+        return self._extract_from_word_docx(word_path, info, max_chars)
     
-    def _extract_from_word(self, word_path):
-        """Extrae texto de documento Word"""
-        text = ""
+    def _extract_from_word_docx(self, word_path, info, max_chars=None):
+        """Extrae texto de documento Word con python-docx"""
+        parts = []
+        num_chars = 0
         try:
-            doc = Document(word_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            doc = Document(_rewind(word_path))
+            blocks = [paragraph.text for paragraph in doc.paragraphs]
             
-            # Extraer texto de tablas
+            # Extraer texto de tablas (row.cells repite las celdas combinadas)
             for table in doc.tables:
                 for row in table.rows:
+                    seen = set()
+                    row_cells = []
                     for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+                        if id(cell._tc) not in seen:
+                            seen.add(id(cell._tc))
+                            row_cells.append(cell.text)
+                    blocks.append(' '.join(row_cells))
+            
+            for block in blocks:
+                if max_chars is not None and num_chars >= max_chars:
+                    info['truncated'] = True
+                    break
+                parts.append(block)
+                num_chars += len(block) + 1
         except Exception as e:
-            print(f"Error en Word {word_path}: {e}")
-        return text
+            logger.warning("Error en Word %s: %s", word_path, e)
+        return '\n'.join(parts) + '\n' if parts else ""
+    
+    def _preprocess_image(self, image, color_conversion=cv2.COLOR_BGR2GRAY):
+        """Convierte a escala de grises y mejora el contraste"""
+        gray = cv2.cvtColor(image, color_conversion)
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
+        return clahe.apply(gray)
     
-    def _extract_from_image(self, image_path):
-        """Extrae texto de imagen usando OCR"""
+    def _extract_from_image(self, image_path, reduction=None, info=None):
+        """Extrae texto de imagen usando OCR
+        
+        Con reduction (2, 4 u 8) la imagen se decodifica ya reducida.
+        """
+        if info is None:
+            info = {}
         try:
-            # Preprocesar imagen
-            image = cv2.imread(image_path)
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Mejorar contraste
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-            gray = clahe.apply(gray)
+            # Preprocesar imagen (los buffers en memoria se decodifican sin disco)
+            flags = IMREAD_REDUCED_FLAGS.get(reduction, cv2.IMREAD_COLOR)
+            if _is_path(image_path):
+                image = cv2.imread(image_path, flags)
+            else:
+                image = cv2.imdecode(np.frombuffer(image_path.getbuffer(), dtype=np.uint8), flags)
+            gray = self._preprocess_image(image)
             
-            # OCR
-            config = '--lang spa --oem 3 --psm 6'
-            text = pytesseract.image_to_string(gray, config=config)
-            return text
+            # OCR con el pool de workers persistentes
+            return self._recognize(gray, info)
         except Exception as e:
-            print(f"Error en imagen {image_path}: {e}")
+            logger.warning("Error en imagen %s: %s", image_path, e)
             # Fallback con PIL
             try:
-                img = Image.open(image_path)
-                text = pytesseract.image_to_string(img, lang='spa')
-                return text
+                img = Image.open(_rewind(image_path))
+                if reduction:
+                    img = img.reduce(reduction)
+                return self.ocr_engine.recognize(img)['text']
             except:
                 return ""
     
-    def clean_text(self, text):
-        """Limpia y normaliza el texto"""
+    def _recognize(self, gray, info):
+        """OCR de una imagen preprocesada, con el idioma detectado si corresponde
+        
+        El idioma se detecta una vez por documento (en la primera página con
+        OCR) y queda en info['ocr_lang'] para las siguientes.
+        """
+        lang = None
+        if self.ocr_auto_language:
+            if 'ocr_lang' not in info:
+                info['ocr_lang'] = self._probe_ocr_language(gray)
+            lang = info['ocr_lang']
+        return self.ocr_engine.recognize(gray, lang)['text']
+    
+    def _probe_ocr_language(self, gray):
+        """Elige el paquete de Tesseract leyendo una franja central de la imagen
+        
+        La franja se reconoce con spa+eng; si su texto es claramente de un
+        idioma, la imagen completa se reconoce solo con ese paquete, que
+        es bastante más rápido que el combinado. Si la franja no basta para
+        decidir se usa el idioma configurado del motor (None).
+        """
+        height = gray.shape[0]
+        band = max(1, int(height * OCR_PROBE_FRACTION))
+        top = (height - band) // 2
+        probe = gray[top:top + band]
+        text = self.ocr_engine.recognize(probe, language.tesseract_lang('mixed'))['text']
+        return language.tesseract_lang(language.detect_language(text))
+    
+    def detect_language(self, text):
+        """Idioma del texto: 'es', 'en', 'mixed' o 'unknown'"""
+        return language.detect_language(text)
+    
+    def clean_text(self, text, fold_accents=None, normalize_unicode=None):
+        """Limpia y normaliza el texto
+        
+        fold_accents y normalize_unicode (NFKC) toman por defecto los valores
+        configurados en el procesador.
+        """
         if not text:
             return ""
         
+        if fold_accents is None:
+            fold_accents = self.fold_accents
+        if normalize_unicode is None:
+            normalize_unicode = self.normalize_unicode
+        
+        if normalize_unicode:
+            text = text_normalization.normalize_unicode(text)
+        
         # Convertir a minúsculas
         text = text.lower()
         
-        # Remover caracteres especiales pero mantener espacios y puntos
-        text = re.sub(r'[^\w\s\.\@\-\+\(\),;:]', ' ', text)
+        if fold_accents:
+            text = text_normalization.fold_accents(text)
         
-        # Normalizar espacios
-        text = re.sub(r'\s+', ' ', text)
+        # Remover caracteres especiales pero mantener espacios y puntos
+        text = SPECIAL_CHARS_PATTERN.sub(' ', text)
         
-        # Remover líneas muy cortas
-        lines = text.split('\n')
-        clean_lines = [line.strip() for line in lines if len(line.strip()) > 3]
+        # Normalizar espacios (equivale a \s+ -> ' ' y strip, pero más rápido)
+        text = ' '.join(text.split())
         
-        return ' '.join(clean_lines).strip()
+        # Descartar textos demasiado cortos
+        return text if len(text) > 3 else ""
+    
+    def clean_texts(self, texts, fold_accents=None, normalize_unicode=None):
+        """Limpia un lote de textos (cualquier iterable) y retorna una lista"""
+        clean_text = self.clean_text
+        return [clean_text(text, fold_accents, normalize_unicode) for text in texts]
     
     def extract_features(self, text):
         """Extrae características específicas del CV"""
@@ -119,123 +601,456 @@ class CVProcessor:
             'experience_years': [],
             'education_keywords': [],
             'skills': [],
+            'skill_groups': {},
+            'keyword_counts': {},
+            'keyword_positions': {},
             'text_length': len(text),
             'word_count': len(text.split())
         }
         
         # Extraer emails
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        features['emails'] = re.findall(email_pattern, text)
+        features['emails'] = EMAIL_PATTERN.findall(text)
         
         # Extraer teléfonos
-        phone_pattern = r'[\+]?[\d\s\-\(\)]{8,15}'
-        features['phones'] = re.findall(phone_pattern, text)
+        features['phones'] = PHONE_PATTERN.findall(text)
         
         # Buscar años de experiencia
-        exp_patterns = [
-            r'(\d+)\s*años?\s*de\s*experiencia',
-            r'experiencia\s*de\s*(\d+)\s*años?',
-            r'(\d+)\s*years?\s*of\s*experience'
-        ]
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            features['experience_years'].extend(matches)
-        
-        # Keywords de educación
-        education_keywords = [
-            'universidad', 'licenciatura', 'ingeniería', 'maestría', 'doctorado',
-            'técnico', 'certificación', 'diplomado', 'bachillerato', 'carrera',
-            'university', 'bachelor', 'master', 'phd', 'degree'
-        ]
-        for keyword in education_keywords:
-            if keyword in text:
-                features['education_keywords'].append(keyword)
-        
-        # Keywords de habilidades por profesión
-        skill_keywords = [
-            # Tecnología
-            'python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'angular',
-            'node.js', 'php', 'c++', 'c#', '.net', 'spring', 'django', 'flask',
-            'git', 'docker', 'kubernetes', 'aws', 'azure', 'linux', 'windows',
-            
-            # Data Science
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'pandas',
-            'numpy', 'scikit-learn', 'tableau', 'power bi', 'excel', 'r',
-            'statistics', 'data analysis', 'big data', 'hadoop', 'spark',
-            
-            # Marketing
-            'marketing digital', 'seo', 'sem', 'google ads', 'facebook ads',
-            'social media', 'content marketing', 'email marketing', 'analytics',
-            'photoshop', 'illustrator', 'canva', 'hootsuite',
-            
-            # Diseño
-            'diseño gráfico', 'ui/ux', 'figma', 'sketch', 'adobe creative',
-            'after effects', 'premiere', 'indesign', 'branding', 'tipografía',
-            
-            # Ventas
-            'ventas', 'sales', 'crm', 'salesforce', 'negociación', 'prospección',
-            'atención al cliente', 'customer service', 'retail',
-            
-            # Administración
-            'administración', 'gestión', 'management', 'liderazgo', 'proyectos',
-            'planificación', 'presupuestos', 'finanzas', 'contabilidad', 'rrhh',
-            
-            # Agricultura
-            'agricultura', 'agronomía', 'cultivos', 'riego', 'fertilizantes',
-            'pesticidas', 'maquinaria agrícola', 'ganadería', 'veterinaria',
-            'producción agrícola', 'agropecuario', 'campo'
-        ]
+        for pattern in EXPERIENCE_PATTERNS:
+            features['experience_years'].extend(pattern.findall(text))
         
-        for skill in skill_keywords:
-            if skill in text:
-                features['skills'].append(skill)
+        # Keywords de educación y habilidades (palabra completa, una pasada)
+        features.update(self.taxonomy.match(text))
         
         return features
     
-    def process_cv_folder(self, folder_path, profession_name):
-        """Procesa todos los CVs de una carpeta para una profesión específica"""
-        results = []
-        
-        if not os.path.exists(folder_path):
-            print(f"La carpeta {folder_path} no existe")
-            return results
+    def featurize_batch(self, texts, as_dataframe=False, binary=False):
+        """Caracteriza un lote de textos limpios en formato columnar
         
-        files = [f for f in os.listdir(folder_path) 
-                if os.path.splitext(f.lower())[1] in self.supported_formats]
+        Retorna (matriz CSR, nombres de columnas) o, con as_dataframe, un
+        DataFrame disperso con una fila por texto.
+        """
+        builder = FeatureTableBuilder.from_taxonomy(self.taxonomy, binary=binary)
+        features = (self.extract_features(text) for text in texts)
+        if as_dataframe:
+            return builder.to_dataframe(features)
+        return builder.to_sparse(features), builder.columns
+    
+    def results_to_feature_table(self, results, binary=False):
+        """DataFrame de características de los resultados de process_cv_folder"""
+        results = list(results)
+        builder = FeatureTableBuilder.from_taxonomy(self.taxonomy, binary=binary)
+        return builder.to_dataframe((r['features'] for r in results),
+                                    index=[r['file_name'] for r in results])
+    
+    def preflight(self, file_path, name=None):
+        """Inspecciona tamaño y dimensiones del archivo sin decodificarlo
         
-        print(f"Procesando {len(files)} archivos para la profesión: {profession_name}")
+        Retorna el plan de preflight.inspect_file según max_file_size_mb y
+        max_image_pixels.
+        """
+        if not self.max_file_size_mb and not self.max_image_pixels:
+            return {'action': 'full'}
+        return preflight.inspect_file(file_path, self.max_file_size_mb, self.max_image_pixels,
+                                      name=name)
+    
+    def _budget_for(self, plan):
+        """Presupuesto de extracción ajustado al plan de preflight"""
+        budget = dict(self.extraction_budget or {})
+        if plan['action'] == 'truncate':
+            for key, limit in preflight.OVERSIZED_BUDGET.items():
+                if budget.get(key) is None or budget[key] > limit:
+                    budget[key] = limit
+        elif plan['action'] == 'downsample':
+            budget['image_reduction'] = plan['reduction']
+        return budget
+    
+    def process_cv_file(self, file_path, profession_name, file_name=None):
+        """Extrae, limpia y caracteriza un único CV
         
-        for file_name in files:
-            file_path = os.path.join(folder_path, file_name)
+        file_name identifica el resultado (por defecto el nombre del archivo).
+        """
+        return self._process_source(file_path, file_name or os.path.basename(file_path),
+                                    profession_name)
+    
+    def process_cv_bytes(self, file_name, data, profession_name):
+        """Como process_cv_file, pero con el contenido del archivo en memoria"""
+        return self._process_source(io.BytesIO(data), file_name, profession_name)
+    
+    def _process_source(self, source, file_name, profession_name):
+        """Procesa una ruta o un buffer en memoria; file_name da el formato"""
+        try:
+            # Descartar o acotar los archivos grandes antes de abrirlos
+            start = time.perf_counter()
+            plan = self.preflight(source, file_name)
+            preflight_seconds = time.perf_counter() - start
+            if plan['action'] == 'skip':
+                result = self._failed_result(file_name, profession_name, 'skipped', plan['reason'])
+                result['extraction'] = {'preflight': plan}
+                return result
             
-            # Extraer texto
-            raw_text = self.extract_text_from_file(file_path)
-            clean_text = self.clean_text(raw_text)
+            # Extraer texto (desde caché si el archivo no ha cambiado)
+            info = {'bytes': preflight.file_size(source)}
+            if plan['action'] != 'full':
+                info['preflight'] = plan
+            raw_text, clean_text, cache_hit = self.extract_and_clean(
+                source, info, self._budget_for(plan), file_name
+            )
+            timings = info['timings']
+            timings['preflight'] = preflight_seconds
             
             if clean_text:
                 # Extraer características
+                start = time.perf_counter()
                 features = self.extract_features(clean_text)
+                timings['features'] = time.perf_counter() - start
                 
-                result = {
+                return {
                     'file_name': file_name,
                     'profession': profession_name,
                     'text': clean_text,
                     'features': features,
-                    'status': 'success'
+                    'language': self.detect_language(clean_text),
+                    'status': 'success',
+                    'cache_hit': cache_hit,
+                    'extraction': info
                 }
+            
+            return {
+                'file_name': file_name,
+                'profession': profession_name,
+                'text': '',
+                'features': {},
+                'status': 'failed',
+                'cache_hit': cache_hit,
+                'extraction': info
+            }
+        except Exception as e:
+            # Un fallo en un archivo no debe detener el lote
+            return self._failed_result(file_name, profession_name, 'error', str(e))
+    
+    def _failed_result(self, file_name, profession_name, status, error):
+        """Resultado de un archivo que no pudo procesarse"""
+        return {
+            'file_name': file_name,
+            'profession': profession_name,
+            'text': '',
+            'features': {},
+            'status': status,
+            'error': error
+        }
+    
+    def process_cv_files(self, file_paths, profession_name, root=None):
+        """Procesa una lista de archivos (unidad de trabajo de los workers)"""
+        return [self.process_cv_file(file_path, profession_name, self._file_name(file_path, root))
+                for file_path in file_paths]
+    
+    def _file_name(self, file_path, root=None):
+        """file_name de un resultado: relativo a root o, sin root, el nombre base"""
+        return relative_name(file_path, root) if root else os.path.basename(file_path)
+    
+    def list_cv_files(self, folder_path, recursive=False):
+        """Lista en orden estable los archivos soportados de una carpeta"""
+        if recursive:
+            return CorpusScanner(folder_path, self.supported_formats).list_files()
+        files = sorted(f for f in os.listdir(folder_path)
+                       if os.path.splitext(f.lower())[1] in self.supported_formats)
+        return [os.path.join(folder_path, f) for f in files]
+    
+    def scanner(self, folder_path, manifest_path=None):
+        """CorpusScanner incremental sobre una carpeta con los formatos soportados"""
+        return CorpusScanner(folder_path, self.supported_formats, manifest_path)
+    
+    def iter_cv_folder(self, folder_path, profession_name, workers=None, chunksize=1,
+                       batch_size=None, file_timeout=None, memory_limit_mb=None,
+                       recursive=False):
+        """Genera los resultados de una carpeta uno a uno, sin acumularlos
+        
+        Con workers > 1 se mantienen como máximo 2 * workers bloques de
+        chunksize archivos en vuelo, de modo que la memoria no crece con el
+        tamaño de la carpeta. Con batch_size se generan listas de ese tamaño.
+        
+        Con file_timeout (segundos) o memory_limit_mb cada archivo se procesa
+        en un proceso vigilado: si se cuelga o agota la memoria se mata y el
+        archivo se reporta con estado 'timeout' o 'crashed'.
+        
+        Los resultados se nombran con la ruta relativa a la carpeta
+        ('sub/cv.pdf' con recursive), de modo que no colisionan en un
+        CorpusStore.
+        """
+        if batch_size:
+            batch = []
+            for result in self.iter_cv_folder(folder_path, profession_name,
+                                              workers=workers, chunksize=chunksize,
+                                              file_timeout=file_timeout,
+                                              memory_limit_mb=memory_limit_mb,
+                                              recursive=recursive):
+                batch.append(result)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            return
+        
+        if not os.path.exists(folder_path):
+            logger.warning("La carpeta %s no existe", folder_path)
+            return
+        
+        # Un zip/tar se procesa directamente, sin descomprimirlo a disco
+        if archive_reader.is_archive(folder_path):
+            yield from self.iter_cv_archive(folder_path, profession_name, workers=workers,
+                                            chunksize=chunksize, file_timeout=file_timeout,
+                                            memory_limit_mb=memory_limit_mb)
+            return
+        
+        file_paths = self.list_cv_files(folder_path, recursive)
+        
+        logger.info("Procesando %d archivos para la profesión: %s", len(file_paths), profession_name)
+        
+        yield from self.iter_cv_paths(file_paths, profession_name, workers=workers,
+                                      chunksize=chunksize, file_timeout=file_timeout,
+                                      memory_limit_mb=memory_limit_mb, root=folder_path)
+    
+    def iter_cv_paths(self, file_paths, profession_name, workers=None, chunksize=1,
+                      file_timeout=None, memory_limit_mb=None, root=None):
+        """Genera en orden los resultados de una lista de archivos
+        
+        Es el núcleo de iter_cv_folder; sirve también para procesar solo el
+        delta (added + changed) de un CorpusScanner, pasando root=scanner.root
+        para que los resultados se nombren con la ruta relativa a la raíz.
+        """
+        file_paths = list(file_paths)
+        self.metrics.start_run()
+        progress = self._progress(profession_name, len(file_paths))
+        if file_timeout or memory_limit_mb:
+            yield from self._iter_isolated(file_paths, profession_name, progress, workers,
+                                           file_timeout, memory_limit_mb, root)
+        elif workers and workers > 1 and len(file_paths) > 1:
+            yield from self._iter_pool(file_paths, profession_name, progress, workers, chunksize,
+                                       root)
+        else:
+            for file_path in file_paths:
+                result = self.process_cv_file(file_path, profession_name,
+                                              self._file_name(file_path, root))
+                yield self._emit_result(result, progress)
+        progress.close()
+    
+    def _iter_isolated(self, file_paths, profession_name, progress, workers=None,
+                       file_timeout=None, memory_limit_mb=None, root=None):
+        """Procesa cada archivo en un proceso vigilado (IsolatedExecutor)"""
+        executor = IsolatedExecutor(self.process_cv_file, workers=workers,
+                                    timeout=file_timeout,
+                                    memory_limit_mb=memory_limit_mb)
+        file_names = [self._file_name(file_path, root) for file_path in file_paths]
+        outcomes = executor.map(zip(file_paths, [profession_name] * len(file_paths), file_names))
+        for (status, payload), file_name in zip(outcomes, file_names):
+            if status == 'ok':
+                yield self._emit_result(payload, progress, from_worker=True)
             else:
-                result = {
-                    'file_name': file_name,
-                    'profession': profession_name,
-                    'text': '',
-                    'features': {},
-                    'status': 'failed'
-                }
+                yield self._emit_result(self._failed_result(
+                    file_name, profession_name, status, payload
+                ), progress)
+    
+    def _iter_pool(self, file_paths, profession_name, progress, workers, chunksize=1,
+                   root=None):
+        """Procesa bloques de chunksize archivos en un pool de procesos, en orden"""
+        chunksize = max(1, chunksize)
+        chunks = (file_paths[i:i + chunksize] for i in range(0, len(file_paths), chunksize))
+        pool_func = functools.partial(_pool_process_files, profession_name=profession_name,
+                                      root=root)
+        
+        def retry(paths, retry_workers):
+            return self._iter_isolated(paths, profession_name, progress, retry_workers,
+                                       root=root)
+        
+        yield from self._iter_pool_chunks(chunks, pool_func, retry, progress, workers)
+    
+    def _iter_pool_chunks(self, chunks, pool_func, retry, progress, workers):
+        """Ejecuta pool_func(bloque) en un pool de procesos y genera los resultados en orden
+        
+        chunks puede ser un generador: se consume a medida que hay hueco,
+        con como máximo 2 * workers bloques en vuelo. Si un worker muere (un
+        fallo nativo de PyPDF2, cv2 o Tesseract) el pool entero queda roto:
+        las tareas de los bloques que no terminaron se repiten juntas con
+        retry(tareas, workers), en procesos vigilados que reportan como
+        'crashed' solo a la culpable, y el lote continúa con un pool nuevo.
+        """
+        chunks = iter(chunks)
+        max_in_flight = 2 * workers
+        
+        executor = self._new_pool(workers)
+        pending = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                    else:
+                        pending.append((executor.submit(pool_func, chunk), chunk))
+                if not pending:
+                    break
+                
+                # Esperar siempre al bloque más antiguo para conservar el orden
+                future, chunk = pending[0]
+                try:
+                    future.result()
+                except BrokenProcessPool:
+                    logger.warning("Un worker terminó abruptamente; los bloques sin terminar "
+                                   "se reintentan en procesos vigilados")
+                    executor.shutdown(wait=False)
+                    executor = self._new_pool(workers)
+                    # Los bloques ya terminados conservan su resultado; los demás se
+                    # repiten juntos en una sola tanda de procesos vigilados
+                    outcomes = [(chunk, None if future.exception() else future.result())
+                                for future, chunk in pending]
+                    pending.clear()
+                    tasks = [task for chunk, results in outcomes if results is None
+                             for task in chunk]
+                    retried = retry(tasks, min(workers, len(tasks)))
+                    for chunk, results in outcomes:
+                        if results is None:
+                            for _ in chunk:
+                                yield next(retried)
+                        else:
+                            for result in results:
+                                yield self._emit_result(result, progress, from_worker=True)
+                    continue
+                
+                pending.popleft()
+                for result in future.result():
+                    yield self._emit_result(result, progress, from_worker=True)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _new_pool(self, workers):
+        """Pool de procesos que recibe este procesador una sola vez por worker"""
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_pool_worker,
+                                   initargs=(self,))
+    
+    def iter_cv_archive(self, archive_path, profession_name, workers=None, chunksize=1,
+                        file_timeout=None, memory_limit_mb=None):
+        """Genera los resultados de los CVs de un zip o tar sin descomprimirlo
+        
+        Cada miembro se lee a memoria y pasa por los extractores desde un
+        buffer. Solo hay un miembro en memoria a la vez (como máximo
+        2 * workers bloques de chunksize con workers > 1). Los resultados se
+        nombran 'archivo.zip:ruta/del/miembro'.
+        
+        Con file_timeout o memory_limit_mb cada miembro se procesa en un
+        proceso vigilado, igual que los archivos de una carpeta.
+        """
+        archive_name = os.path.basename(archive_path)
+        max_member_bytes = None
+        if self.max_file_size_mb:
+            max_member_bytes = self.max_file_size_mb * preflight.OVERSIZE_SKIP_FACTOR * 1024 * 1024
+        members = archive_reader.iter_archive_members(archive_path, self.supported_formats,
+                                                      max_member_bytes)
+        tasks = ((f"{archive_name}:{member_name}", data, profession_name)
+                 for member_name, data in members)
+        
+        logger.info("Procesando %s para la profesión: %s", archive_name, profession_name)
+        self.metrics.start_run()
+        progress = self._progress(profession_name)
+        
+        if file_timeout or memory_limit_mb:
+            yield from self._iter_isolated_members(tasks, profession_name, progress, workers,
+                                                   file_timeout, memory_limit_mb)
+        elif workers and workers > 1:
+            def retry(member_tasks, retry_workers):
+                return self._iter_isolated_members(member_tasks, profession_name, progress,
+                                                   retry_workers)
             
-            results.append(result)
-            print(f"  ✓ {file_name} - {result['status']}")
+            yield from self._iter_pool_chunks(_chunked(tasks, max(1, chunksize)),
+                                              _pool_process_members, retry, progress, workers)
+        else:
+            for task in tasks:
+                yield self._emit_result(self.process_archive_member(*task), progress)
+        progress.close()
+    
+    def _iter_isolated_members(self, tasks, profession_name, progress, workers=None,
+                               file_timeout=None, memory_limit_mb=None):
+        """Procesa cada miembro (file_name, data, profesión) en un proceso vigilado"""
+        executor = IsolatedExecutor(self.process_archive_member, workers=workers,
+                                    timeout=file_timeout,
+                                    memory_limit_mb=memory_limit_mb)
+        pending = deque()
+        
+        def watched_tasks():
+            # Los nombres se guardan para reportar los miembros que fallen
+            for task in tasks:
+                pending.append(task[0])
+                yield task
+        
+        for status, payload in executor.map(watched_tasks()):
+            file_name = pending.popleft()
+            if status == 'ok':
+                yield self._emit_result(payload, progress, from_worker=True)
+            else:
+                yield self._emit_result(self._failed_result(
+                    file_name, profession_name, status, payload
+                ), progress)
+    
+    def process_archive_member(self, file_name, data, profession_name):
+        """Procesa un miembro de un archivo comprimido (data None: demasiado grande)"""
+        if data is None:
+            return self._failed_result(file_name, profession_name, 'skipped',
+                                       'miembro demasiado grande')
+        return self.process_cv_bytes(file_name, data, profession_name)
+    
+    def process_archive_members(self, tasks):
+        """Procesa un bloque de miembros (unidad de trabajo de los workers)"""
+        return [self.process_archive_member(*task) for task in tasks]
+    
+    def iter_corpus(self, profession_folders, **kwargs):
+        """Genera los resultados de todas las carpetas {profesión: carpeta}"""
+        for profession, folder_path in profession_folders.items():
+            yield from self.iter_cv_folder(folder_path, profession, **kwargs)
+    
+    def process_cv_folder(self, folder_path, profession_name, workers=None, chunksize=1,
+                          file_timeout=None, memory_limit_mb=None):
+        """Procesa todos los CVs de una carpeta para una profesión específica
         
-        return results
+        Con workers > 1 el procesamiento se reparte en un pool de procesos;
+        los resultados se devuelven en el mismo orden que la lista de archivos.
+        """
+        return list(self.iter_cv_folder(folder_path, profession_name,
+                                        workers=workers, chunksize=chunksize,
+                                        file_timeout=file_timeout,
+                                        memory_limit_mb=memory_limit_mb))
+    
+    def _progress(self, label, total=None):
+        """Reporte de progreso agregado para un lote"""
+        return ProgressReporter(logger, label, total=total, every_n=self.progress_every_n,
+                                every_s=self.progress_every_s)
+    
+    def _emit_result(self, result, progress, from_worker=False):
+        """Registra un resultado en este proceso (caché, métricas y progreso)"""
+        if from_worker:
+            self._record_cache_result(result)
+        self.metrics.add_result(result)
+        progress.update(result)
+        return result
+    
+    def get_metrics_summary(self):
+        """Resumen por formato de los tiempos por etapa (p50/p95/p99 y throughput)"""
+        return self.metrics.summary()
+    
+    def _record_cache_result(self, result):
+        """Acumula en este proceso los aciertos de caché de los workers"""
+        if self.cache is None or result.get('cache_hit') is None:
+            return
+        if result['cache_hit']:
+            self.cache.hits += 1
+        else:
+            self.cache.misses += 1
+    
+    def get_cache_stats(self):
+        """Retorna los contadores de la caché de extracción"""
+        if self.cache is None:
+            return None
+        return self.cache.get_stats()
     
     def is_supported_file(self, file_path):
         """Verifica si el archivo tiene un formato soportado"""
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Detección de CVs casi duplicados con MinHash y LSH por bandas
+"""
+
+import zlib
+
+import numpy as np
+
+# Primo mayor que 2**32 para el hashing universal (a * x + b) mod p
+_PRIME = np.uint64((1 << 32) + 15)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingle_hashes(text, shingle_size=5):
+    """Hashes (uint64) de los k-shingles de palabras del texto, sin repetir"""
+    words = text.split()
+    if len(words) <= shingle_size:
+        shingles = [' '.join(words)] if words else []
+    else:
+        shingles = {' '.join(words[i:i + shingle_size])
+                    for i in range(len(words) - shingle_size + 1)}
+    return np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+                       dtype=np.uint64, count=len(shingles))
+
+
+def choose_bands(num_perm, threshold, recall=0.95):
+    """Elige (bandas, filas) para el LSH
+
+    Se toma el mayor número de filas por banda (menos candidatos falsos)
+    con el que un par de similitud igual al umbral sigue siendo candidato
+    con probabilidad >= recall; la verificación posterior con la firma
+    completa descarta los candidatos por debajo del umbral.
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold ** rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+class NearDuplicateFilter:
+    """Filtro en streaming de CVs casi duplicados
+
+    Cada texto se resume en una firma MinHash de num_perm valores; la
+    fracción de valores iguales entre dos firmas estima la similitud de
+    Jaccard de sus shingles. Las firmas se agrupan por bandas (LSH), de modo
+    que solo se comparan los CVs que coinciden en alguna banda: el costo es
+    casi lineal en el número de CVs en lugar de cuadrático.
+
+    Se conserva el primer CV de cada grupo de casi duplicados. Con
+    mode='drop' los demás se descartan; con mode='report' se generan todos
+    y los duplicados llevan 'duplicate_of' y 'similarity'.
+    """
+
+    def __init__(self, threshold=0.9, num_perm=128, shingle_size=5, mode='drop', seed=1):
+        if mode not in ('drop', 'report'):
+            raise ValueError(f"Modo no soportado: {mode}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.mode = mode
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+
+        self._buckets = [{} for _ in range(self.bands)]
+        self._signatures = []
+        self._names = []
+        self.duplicates = []
+
+    def signature(self, text):
+        """Firma MinHash (uint32) del texto"""
+        hashes = shingle_hashes(text, self.shingle_size)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        # a < 2**32 y x < 2**32: a * x + b no desborda uint64
+        permuted = (self._a * hashes[None, :] + self._b) % _PRIME
+        return np.minimum(permuted.min(axis=1), _MAX_HASH).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        # Si bandas * filas < num_perm, los últimos valores solo se usan al verificar
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+    def check(self, text, name=None):
+        """Retorna (nombre del original, similitud) o None y registra el texto"""
+        signature = self.signature(text)
+        keys = self._band_keys(signature)
+
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best = None
+        for index in candidates:
+            similarity = float(np.mean(self._signatures[index] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (self._names[index], similarity)
+        if best is not None:
+            return best
+
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        self._names.append(name if name is not None else index)
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(index)
+        return None
+
+    def filter(self, results):
+        """Genera los resultados de process_cv_file sin los casi duplicados
+
+        Solo se comparan los resultados con status 'success'; el resto pasa
+        sin cambios.
+        """
+        for result in results:
+            if result.get('status') != 'success':
+                yield result
+                continue
+
+            name = (result.get('profession'), result.get('file_name'))
+            match = self.check(result['text'], name)
+            if match is None:
+                yield result
+                continue
+
+            original, similarity = match
+            self.duplicates.append({'file_name': result.get('file_name'),
+                                    'profession': result.get('profession'),
+                                    'duplicate_of': original,
+                                    'similarity': similarity})
+            if self.mode == 'report':
+                yield dict(result, duplicate_of=original, similarity=similarity)
+
+    def get_stats(self):
+        """Número de CVs únicos y de duplicados encontrados"""
+        return {
+            'unique': len(self._signatures),
+            'duplicates': len(self.duplicates),
+            'bands': self.bands,
+            'rows': self.rows
+        }
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Extractor rápido de DOCX: lee word/document.xml en streaming desde el zip
+"""
+
+import zipfile
+import xml.etree.ElementTree as ET
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+P = W_NS + 'p'
+T = W_NS + 't'
+TAB = W_NS + 'tab'
+BR = W_NS + 'br'
+CR = W_NS + 'cr'
+TR = W_NS + 'tr'
+TC = W_NS + 'tc'
+V_MERGE = W_NS + 'vMerge'
+H_MERGE = W_NS + 'hMerge'
+VAL = W_NS + 'val'
+
+
+def iter_docx_blocks(source):
+    """Genera el texto de párrafos y filas de tabla en orden de documento
+
+    source puede ser una ruta o un objeto tipo archivo con el zip del
+    DOCX. Cada fila de tabla se emite como una línea con sus celdas
+    separadas por espacios; las celdas que continúan una combinación
+    (vMerge/hMerge) se omiten para no repetir su texto.
+    """
+    with zipfile.ZipFile(source) as archive:
+        with archive.open('word/document.xml') as stream:
+            paragraphs = []  # pila de párrafos abiertos (cuadros de texto anidados)
+            rows = []        # pila de filas abiertas (tablas anidadas)
+            cells = []       # pila de celdas abiertas
+
+            for event, elem in ET.iterparse(stream, events=('start', 'end')):
+                tag = elem.tag
+
+                if event == 'start':
+                    if tag == P:
+                        paragraphs.append([])
+                    elif tag == TR:
+                        rows.append([])
+                    elif tag == TC:
+                        cells.append({'paragraphs': [], 'merged': False})
+                    elif tag in (V_MERGE, H_MERGE) and cells:
+                        # Sin val (o val="continue") la celda continúa la anterior
+                        if elem.get(VAL, 'continue') != 'restart':
+                            cells[-1]['merged'] = True
+                    continue
+
+                if tag == T:
+                    if paragraphs:
+                        paragraphs[-1].append(elem.text or '')
+                elif tag == TAB:
+                    if paragraphs:
+                        paragraphs[-1].append('\t')
+                elif tag in (BR, CR):
+                    if paragraphs:
+                        paragraphs[-1].append('\n')
+                elif tag == P:
+                    text = ''.join(paragraphs.pop())
+                    elem.clear()
+                    if cells:
+                        cells[-1]['paragraphs'].append(text)
+                    elif paragraphs:
+                        paragraphs[-1].append(text)
+                    else:
+                        yield text
+                elif tag == TC:
+                    cell = cells.pop()
+                    elem.clear()
+                    if not cell['merged'] and rows:
+                        rows[-1].append('\n'.join(cell['paragraphs']))
+                elif tag == TR:
+                    line = ' '.join(rows.pop())
+                    elem.clear()
+                    if cells:
+                        cells[-1]['paragraphs'].append(line)
+                    else:
+                        yield line
+
+
+def extract_docx_text(source, max_chars=None):
+    """Extrae el texto de un DOCX; con max_chars se detiene al alcanzarlo
+
+    Retorna (texto, truncado).
+    """
+    blocks = []
+    num_chars = 0
+    truncated = False
+    for block in iter_docx_blocks(source):
+        if max_chars is not None and num_chars >= max_chars:
+            truncated = True
+            break
+        blocks.append(block)
+        num_chars += len(block) + 1
+    return ('\n'.join(blocks) + '\n' if blocks else ''), truncated
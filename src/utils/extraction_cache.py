@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Caché persistente de extracción de texto direccionada por contenido
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+# Incrementar cuando cambie la lógica de extracción o limpieza para
+# invalidar las entradas guardadas con versiones anteriores
+EXTRACTOR_VERSION = "4"
+
+# Accesos (last_access) acumulados antes de escribirlos en un solo commit
+TOUCH_BATCH_SIZE = 256
+
+# Al superar el tamaño máximo se expulsa hasta esta fracción, para no
+# volver a expulsar (y recalcular el total) en cada inserción siguiente
+EVICT_LOW_WATERMARK = 0.9
+
+
+def hash_file(file_path, block_size=1 << 20):
+    """Calcula el hash SHA-256 del contenido de un archivo"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Caché SQLite de texto extraído con expulsión LRU por tamaño
+
+    Los aciertos no escriben en la base: la fecha de acceso se acumula y se
+    guarda por lotes (al insertar, cada TOUCH_BATCH_SIZE aciertos y al
+    cerrar), de modo que un reentrenamiento con casi todo en caché no
+    serializa a los workers en el lock de escritura. El orden LRU es por
+    tanto aproximado. El tamaño total se guarda en la tabla cache_stats y
+    se actualiza en la misma transacción que cada inserción o expulsión,
+    así que el máximo se respeta aunque inserten varios procesos a la vez.
+    """
+
+    def __init__(self, db_path, max_size_mb=512, extractor_version=EXTRACTOR_VERSION):
+        self.db_path = str(db_path)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.extractor_version = extractor_version
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._touched = {}
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __getstate__(self):
+        # La conexión SQLite no se puede serializar hacia otros procesos
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_touched'] = {}
+        return state
+
+    @property
+    def conn(self):
+        """Conexión perezosa (una por proceso)"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # Con WAL, NORMAL solo sincroniza en los checkpoints (sin fsync por commit)
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS extractions (
+                    content_hash TEXT NOT NULL,
+                    extractor_version TEXT NOT NULL,
+                    raw_text TEXT NOT NULL,
+                    clean_text TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    info TEXT,
+                    PRIMARY KEY (content_hash, extractor_version)
+                )
+            """)
+            # Bases creadas antes de guardar los detalles de extracción
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(extractions)")]
+            if 'info' not in columns:
+                self._conn.execute("ALTER TABLE extractions ADD COLUMN info TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_last_access ON extractions(last_access)"
+            )
+            # Tamaño total compartido por todos los procesos (una sola fila)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    total_size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO cache_stats (id, total_size) "
+                "SELECT 0, COALESCE(SUM(size_bytes), 0) FROM extractions"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def make_key(self, source):
+        """Genera la clave de caché de un archivo (ruta o buffer en memoria)"""
+        if isinstance(source, (str, os.PathLike)):
+            return hash_file(source)
+        return hashlib.sha256(source.getbuffer()).hexdigest()
+
+    def get(self, key):
+        """Retorna (raw_text, clean_text, info) o None si no está en caché
+        
+        info es el dict guardado con put (vacío si no se guardó ninguno).
+        """
+        row = self.conn.execute(
+            "SELECT raw_text, clean_text, info FROM extractions "
+            "WHERE content_hash = ? AND extractor_version = ?",
+            (key, self.extractor_version)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touched[key] = time.time()
+        if len(self._touched) >= TOUCH_BATCH_SIZE:
+            self._write_touched()
+            self.conn.commit()
+        return row[0], row[1], json.loads(row[2]) if row[2] else {}
+
+    def _write_touched(self):
+        """Escribe las fechas de acceso acumuladas (sin commit)"""
+        if not self._touched:
+            return
+        self.conn.executemany(
+            "UPDATE extractions SET last_access = ? "
+            "WHERE content_hash = ? AND extractor_version = ?",
+            [(accessed, key, self.extractor_version) for key, accessed in self._touched.items()]
+        )
+        self._touched = {}
+
+    def put(self, key, raw_text, clean_text, info=None):
+        """Guarda el texto crudo y limpio de un archivo
+        
+        info es un dict serializable en JSON con detalles de la extracción
+        (truncado, páginas...) que get devuelve en los aciertos.
+        """
+        size = len(raw_text.encode('utf-8')) + len(clean_text.encode('utf-8'))
+        conn = self.conn
+        self._write_touched()
+        if not conn.in_transaction:
+            # Tomar el lock de escritura antes de leer el tamaño anterior
+            conn.execute("BEGIN IMMEDIATE")
+        previous = conn.execute(
+            "SELECT size_bytes FROM extractions WHERE content_hash = ? AND extractor_version = ?",
+            (key, self.extractor_version)
+        ).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO extractions "
+            "(content_hash, extractor_version, raw_text, clean_text, size_bytes, last_access, info) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, self.extractor_version, raw_text, clean_text, size, time.time(),
+             json.dumps(info) if info else None)
+        )
+        conn.execute("UPDATE cache_stats SET total_size = total_size + ? WHERE id = 0",
+                     (size - (previous[0] if previous else 0),))
+        total = self.total_size()
+        conn.commit()
+        if total > self.max_size_bytes:
+            self._evict()
+
+    def _evict(self):
+        """Expulsa las entradas menos usadas hasta bajar de EVICT_LOW_WATERMARK"""
+        conn = self.conn
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        total = self.total_size()
+        if total <= self.max_size_bytes:
+            conn.commit()
+            return
+        target = self.max_size_bytes * EVICT_LOW_WATERMARK
+
+        cursor = conn.execute(
+            "SELECT content_hash, extractor_version, size_bytes "
+            "FROM extractions ORDER BY last_access ASC"
+        )
+        to_delete = []
+        freed = 0
+        for content_hash, version, size in cursor:
+            if total - freed <= target:
+                break
+            to_delete.append((content_hash, version))
+            freed += size
+
+        conn.executemany(
+            "DELETE FROM extractions WHERE content_hash = ? AND extractor_version = ?",
+            to_delete
+        )
+        conn.execute("UPDATE cache_stats SET total_size = total_size - ? WHERE id = 0",
+                     (freed,))
+        conn.commit()
+
+    def total_size(self):
+        """Tamaño total en bytes del texto almacenado"""
+        return self.conn.execute("SELECT total_size FROM cache_stats WHERE id = 0").fetchone()[0]
+
+    def clear(self):
+        """Vacía la caché y reinicia los contadores"""
+        self._touched = {}
+        self.conn.execute("DELETE FROM extractions")
+        self.conn.execute("UPDATE cache_stats SET total_size = 0 WHERE id = 0")
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Retorna los contadores de aciertos y fallos"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size_bytes': self.total_size()
+        }
+
+    def close(self):
+        """Cierra la conexión"""
+        if self._conn is not None:
+            self._write_touched()
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
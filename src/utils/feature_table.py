@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Tabla columnar de características: una fila por CV, columnas fijas
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+NUMERIC_COLUMNS = ['text_length', 'word_count', 'has_email', 'has_phone', 'max_experience_years']
+
+
+class FeatureTableBuilder:
+    """Convierte los dicts de extract_features en una matriz o DataFrame
+
+    Las columnas se fijan al construir el builder a partir de la taxonomía
+    (skill:<nombre>, edu:<nombre> y las columnas numéricas), de modo que
+    entrenamiento y predicción producen siempre las mismas columnas.
+    """
+
+    def __init__(self, skill_keywords, education_keywords, binary=False):
+        self.skill_keywords = list(skill_keywords)
+        self.education_keywords = list(education_keywords)
+        self.binary = binary
+
+        self.columns = ([f'skill:{k}' for k in self.skill_keywords] +
+                        [f'edu:{k}' for k in self.education_keywords] +
+                        NUMERIC_COLUMNS)
+        self._skill_index = {k: i for i, k in enumerate(self.skill_keywords)}
+        offset = len(self.skill_keywords)
+        self._education_index = {k: offset + i for i, k in enumerate(self.education_keywords)}
+        self._numeric_offset = offset + len(self.education_keywords)
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy, binary=False):
+        """Crea el builder con las columnas de una SkillTaxonomy"""
+        return cls(taxonomy.skill_keywords, taxonomy.education_keywords, binary=binary)
+
+    def to_sparse(self, features_list):
+        """Retorna una matriz CSR (n_cvs x n_columnas) en el orden de entrada"""
+        indptr = [0]
+        indices = []
+        data = []
+        numeric_offset = self._numeric_offset
+
+        for features in features_list:
+            counts = features.get('keyword_counts', {})
+            for keyword, count in counts.items():
+                for index in (self._skill_index.get(keyword), self._education_index.get(keyword)):
+                    if index is not None:
+                        indices.append(index)
+                        data.append(1 if self.binary else count)
+
+            experience = [int(years) for years in features.get('experience_years', [])]
+            numeric = (
+                features.get('text_length', 0),
+                features.get('word_count', 0),
+                1 if features.get('emails') else 0,
+                1 if features.get('phones') else 0,
+                max(experience) if experience else 0
+            )
+            for position, value in enumerate(numeric):
+                if value:
+                    indices.append(numeric_offset + position)
+                    data.append(value)
+
+            indptr.append(len(indices))
+
+        return sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64),
+             np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.columns))
+        )
+
+    def to_dataframe(self, features_list, index=None):
+        """Retorna un DataFrame disperso con una fila por CV"""
+        matrix = self.to_sparse(features_list)
+        frame = pd.DataFrame.sparse.from_spmatrix(matrix, columns=self.columns)
+        if index is not None:
+            frame.index = list(index)
+        return frame
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Búsqueda de múltiples palabras clave en una sola pasada sobre el texto
+"""
+
+import heapq
+import re
+
+WORD_CHAR = re.compile(r'\w')
+
+
+def _build_trie(terms):
+    """Construye un trie de caracteres; la clave '' marca fin de término"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+
+def _boundary(char):
+    """Límite de palabra exigido junto a char: solo si es un carácter de palabra"""
+    return bool(WORD_CHAR.match(char))
+
+
+def _trie_to_regex(node, last_char=None):
+    """Convierte el trie en una expresión regular equivalente
+
+    Las ramas más largas se prueban primero, de modo que en cada posición
+    se obtiene la coincidencia más larga que respete los límites de palabra.
+    El fin de un término solo exige límite de palabra si su último carácter
+    es de palabra ('c++' o 'c#' pueden ir seguidos de cualquier cosa).
+    """
+    alternatives = [re.escape(char) + _trie_to_regex(child, char)
+                    for char, child in sorted(node.items()) if char != '']
+    if '' in node:
+        alternatives.append(r'(?!\w)' if _boundary(last_char) else '')
+
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return '(?:' + '|'.join(alternatives) + ')'
+
+
+def _compile_patterns(trie):
+    """Compila los términos en uno o dos patrones según su primer carácter
+
+    Los que empiezan con letra o dígito exigen límite de palabra delante y
+    usan un lookahead para admitir coincidencias solapadas. Los demás
+    ('.net') empiezan con un literal que el motor busca directamente; entre
+    ellos no se reportan solapamientos.
+    """
+    word_start = {char: child for char, child in trie.items() if _boundary(char)}
+    other_start = {char: child for char, child in trie.items() if not _boundary(char)}
+    patterns = []
+    if word_start:
+        patterns.append(re.compile(rf'(?<!\w)(?=({_trie_to_regex(word_start)}))'))
+    if other_start:
+        patterns.append(re.compile(f'({_trie_to_regex(other_start)})'))
+    return patterns
+
+
+class KeywordMatcher:
+    """Conjunto de términos compilado una vez en un autómata (regex con trie)
+
+    Cada término solo coincide como palabra completa: 'r' no coincide
+    dentro de 'ruby' ni 'sem' dentro de 'semana'. Los bordes que no son
+    letras o dígitos no exigen límite, así '.net' coincide en 'asp.net'.
+    Un término contenido en otra coincidencia más larga no se reporta
+    ('js' dentro de 'node.js'). El texto se recorre una sola vez (dos si hay
+    términos como '.net') y se reportan las apariciones con su posición.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(dict.fromkeys(term for term in terms if term))
+        if self.terms:
+            self.patterns = _compile_patterns(_build_trie(self.terms))
+        else:
+            self.patterns = []
+
+    def finditer(self, text):
+        """Genera (posición, término) por cada aparición en el texto"""
+        if not self.patterns or not text:
+            return
+        if len(self.patterns) == 1:
+            matches = self.patterns[0].finditer(text)
+        else:
+            matches = heapq.merge(*(pattern.finditer(text) for pattern in self.patterns),
+                                  key=lambda match: match.start())
+        covered_until = 0
+        for match in matches:
+            end = match.end(1)
+            # Descartar lo que cae dentro de una coincidencia anterior más larga
+            if end <= covered_until:
+                continue
+            covered_until = end
+            yield match.start(), match.group(1)
+
+    def find_all(self, text):
+        """Retorna {término: [posiciones]} con los términos encontrados"""
+        hits = {}
+        for position, term in self.finditer(text):
+            hits.setdefault(term, []).append(position)
+        return hits
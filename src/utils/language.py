@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Identificación rápida y offline del idioma (español / inglés) por palabras vacías
+"""
+
+import re
+
+# Las palabras comunes a ambos idiomas ('a', 'no') se omiten en las dos listas
+SPANISH_STOPWORDS = frozenset("""
+de la que el en y los del se las por un para con una su al lo como más mas
+pero sus le ya o este sí si porque esta está entre cuando muy sin sobre también
+tambien me hasta hay donde desde todo nos durante todos uno les ni contra otros ese
+eso ante ellos e esto mí antes algunos qué unos yo otro otras otra él tanto esa
+estos mucho quienes nada muchos cual poco ella estar estas algunas algo nosotros mi
+mis tú te ti tu tus ellas nosotras vosotros años experiencia empresa trabajo
+""".split())
+
+ENGLISH_STOPWORDS = frozenset("""
+the of and to in is for on with as by at from that this be are was were an or it
+its have has had not but which their they he she we you your our been will would
+can could should into about over under than then there these those such who whom
+what when where while also more most other some any each both through during
+years experience company work skills team
+""".split())
+
+WORD_PATTERN = re.compile(r'[^\W\d_]+')
+
+# Paquetes de Tesseract por idioma detectado (None: el idioma configurado del motor)
+TESSERACT_LANGS = {'es': 'spa', 'en': 'eng', 'mixed': 'spa+eng', 'unknown': None}
+
+
+def language_scores(text, max_chars=5000):
+    """Cuenta las palabras vacías españolas e inglesas al inicio del texto"""
+    spanish = english = 0
+    for word in WORD_PATTERN.findall(text[:max_chars].lower()):
+        if word in SPANISH_STOPWORDS:
+            spanish += 1
+        if word in ENGLISH_STOPWORDS:
+            english += 1
+    return spanish, english
+
+
+def detect_language(text, min_hits=5, dominance=0.75):
+    """Retorna 'es', 'en', 'mixed' o 'unknown'
+
+    Un idioma gana si aporta al menos dominance de las palabras vacías
+    encontradas; con menos de min_hits el texto es demasiado corto para
+    decidir.
+    """
+    if not text:
+        return 'unknown'
+    spanish, english = language_scores(text)
+    total = spanish + english
+    if total < min_hits:
+        return 'unknown'
+    if spanish / total >= dominance:
+        return 'es'
+    if english / total >= dominance:
+        return 'en'
+    return 'mixed'
+
+
+def tesseract_lang(language):
+    """Paquete de Tesseract para un idioma detectado"""
+    return TESSERACT_LANGS.get(language)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Logging estructurado: configuración, sumidero JSONL y progreso agregado
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import time
+
+# Logger raíz de la aplicación (los módulos usan logging.getLogger(__name__))
+ROOT_LOGGER = 'src'
+
+# Atributos estándar de LogRecord; el resto son campos estructurados (extra=...)
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatea cada registro como una línea JSON con sus campos extra"""
+
+    def format(self, record):
+        entry = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(config, jsonl_path=None):
+    """Configura el logger de la aplicación a partir de Settings.LOGGING_CONFIG
+
+    Consola con el formato configurado y, si se indica jsonl_path (o
+    config['jsonl_path']), un archivo JSONL con todos los registros desde
+    config['jsonl_level'] para análisis posterior. El archivo rota al
+    llegar a config['jsonl_max_mb'] y conserva config['jsonl_backups']
+    copias. Llamarla de nuevo reemplaza los handlers anteriores.
+    """
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        if getattr(handler, '_configured_by_app', False):
+            logger.removeHandler(handler)
+            handler.close()
+
+    console = logging.StreamHandler()
+    console.setLevel(config.get('level', 'INFO'))
+    console.setFormatter(logging.Formatter(config.get('format'), config.get('date_format')))
+    console._configured_by_app = True
+    logger.addHandler(console)
+    levels = [console.level]
+
+    jsonl_path = jsonl_path or config.get('jsonl_path')
+    if jsonl_path:
+        directory = os.path.dirname(str(jsonl_path))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        sink = logging.handlers.RotatingFileHandler(
+            jsonl_path, maxBytes=int(config.get('jsonl_max_mb', 50) * 1024 * 1024),
+            backupCount=config.get('jsonl_backups', 3), encoding='utf-8'
+        )
+        sink.setLevel(config.get('jsonl_level', 'DEBUG'))
+        sink.setFormatter(JsonLinesFormatter())
+        sink._configured_by_app = True
+        logger.addHandler(sink)
+        levels.append(sink.level)
+
+    logger.setLevel(min(levels))
+    logger.propagate = False
+    return logger
+
+
+class ProgressReporter:
+    """Resume el avance de un lote cada every_n archivos o every_s segundos
+
+    El detalle por archivo se registra en DEBUG (llega al JSONL pero no a la
+    consola); en INFO solo aparecen los mensajes agregados.
+    """
+
+    def __init__(self, logger, label, total=None, every_n=500, every_s=5.0):
+        self.logger = logger
+        self.label = label
+        self.total = total
+        self.every_n = every_n
+        self.every_s = every_s
+        self.count = 0
+        self.statuses = {}
+        self._start = time.perf_counter()
+        self._last_count = 0
+        self._last_time = self._start
+
+    def update(self, result):
+        """Registra un resultado y emite el resumen si corresponde"""
+        self.count += 1
+        status = result.get('status')
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s - %s", result.get('file_name'), status, extra={
+                'event': 'file_processed',
+                'file_name': result.get('file_name'),
+                'profession': result.get('profession'),
+                'status': status,
+                'error': result.get('error'),
+                'timings': (result.get('extraction') or {}).get('timings')
+            })
+
+        now = time.perf_counter()
+        if (self.count - self._last_count >= self.every_n
+                or now - self._last_time >= self.every_s):
+            self._report(now)
+
+    def _report(self, now, final=False):
+        elapsed = now - self._start
+        rate = self.count / elapsed if elapsed else 0.0
+        done = f"{self.count}/{self.total}" if self.total else str(self.count)
+        statuses = ', '.join(f"{count} {status}" for status, count in sorted(self.statuses.items()))
+        self.logger.info("%s: %s archivos%s (%s) %.1f archivos/s",
+                         self.label, done, ' en total' if final else '', statuses, rate,
+                         extra={'event': 'progress', 'label': self.label, 'count': self.count,
+                                'total': self.total, 'statuses': dict(self.statuses),
+                                'files_per_s': rate, 'final': final})
+        self._last_count = self.count
+        self._last_time = now
+
+    def close(self):
+        """Emite el resumen final (si se procesó algún archivo)"""
+        if self.count:
+            self._report(time.perf_counter(), final=True)
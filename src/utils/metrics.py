@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Métricas por etapa del pipeline de extracción (tiempos y bytes por formato)
+"""
+
+import json
+import os
+import time
+from array import array
+
+# preflight: inspección previa (tamaño, cabeceras); cache: hash del contenido
+# y consulta; parse: lectura del archivo más extracción/OCR, porque los
+# extractores leen el archivo a medida que lo recorren (PDF por páginas,
+# prefijos con truncado) y separarlas exigiría leerlo dos veces
+STAGES = ('preflight', 'cache', 'parse', 'clean', 'features')
+
+
+def percentile(sorted_values, fraction):
+    """Percentil por rango más cercano de una secuencia ya ordenada"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class PipelineMetrics:
+    """Acumula los tiempos por etapa de cada CV, agrupados por formato
+
+    Cada resultado de process_cv_file trae en result['extraction'] los
+    segundos de cada etapa ('timings') y el tamaño del archivo ('bytes').
+    Solo se guardan floats en arrays compactos, así que puede quedar
+    activo en producción.
+
+    El throughput (archivos/s, MB/s) se calcula sobre el tiempo de reloj
+    de las corridas (de start_run al último resultado), no sobre la suma
+    de segundos por etapa, que con varios workers es tiempo de trabajo
+    acumulado. Los archivos se cuentan por estado, incluidos los
+    omitidos, fallidos, 'timeout' y 'crashed', que no traen tiempos.
+    """
+
+    def __init__(self):
+        self._timings = {}   # (formato, etapa) -> array de segundos
+        self._files = {}     # formato -> [archivos, bytes, segundos de trabajo]
+        self._statuses = {}  # formato -> {estado: archivos}
+        self._wall_time = 0.0    # segundos de las corridas ya cerradas
+        self._run_started = None
+        self._last_result = None
+
+    def start_run(self):
+        """Marca el inicio de una corrida (iter_cv_paths, iter_cv_archive...)"""
+        self._close_run()
+        self._run_started = time.perf_counter()
+
+    def _close_run(self):
+        """Suma al tiempo de reloj la corrida en curso"""
+        if self._run_started is not None and self._last_result is not None:
+            self._wall_time += max(0.0, self._last_result - self._run_started)
+        self._run_started = None
+        self._last_result = None
+
+    def wall_time(self):
+        """Segundos de reloj de las corridas, hasta el último resultado"""
+        current = 0.0
+        if self._run_started is not None and self._last_result is not None:
+            current = max(0.0, self._last_result - self._run_started)
+        return self._wall_time + current
+
+    def add_result(self, result):
+        """Registra un resultado de process_cv_file (también los fallidos)"""
+        now = time.perf_counter()
+        extraction = result.get('extraction') or {}
+        timings = extraction.get('timings') or {}
+        work_seconds = sum(timings.values())
+        if self._run_started is None:
+            # Resultado fuera de una corrida: empieza una con este archivo
+            self._run_started = now - work_seconds
+        self._last_result = now
+
+        file_format = os.path.splitext(result.get('file_name', '').lower())[1] or '?'
+        for stage, seconds in timings.items():
+            values = self._timings.get((file_format, stage))
+            if values is None:
+                values = self._timings[(file_format, stage)] = array('d')
+            values.append(seconds)
+
+        totals = self._files.setdefault(file_format, [0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += extraction.get('bytes', 0)
+        totals[2] += work_seconds
+        statuses = self._statuses.setdefault(file_format, {})
+        status = result.get('status', 'unknown')
+        statuses[status] = statuses.get(status, 0) + 1
+
+    def summary(self):
+        """Retorna {formato: {archivos, estados, MB, archivos/s, MB/s, etapas: {p50, p95, p99...}}}"""
+        summary = {}
+        wall_time = self.wall_time()
+        for file_format, (files, num_bytes, work_seconds) in sorted(self._files.items()):
+            megabytes = num_bytes / (1024 * 1024)
+            stages = {}
+            for stage in STAGES:
+                values = self._timings.get((file_format, stage))
+                if not values:
+                    continue
+                ordered = sorted(values)
+                stages[stage] = {
+                    'count': len(ordered),
+                    'total_s': sum(ordered),
+                    'p50_ms': percentile(ordered, 0.50) * 1000,
+                    'p95_ms': percentile(ordered, 0.95) * 1000,
+                    'p99_ms': percentile(ordered, 0.99) * 1000
+                }
+            summary[file_format] = {
+                'files': files,
+                'statuses': dict(sorted(self._statuses[file_format].items())),
+                'megabytes': megabytes,
+                'work_s': work_seconds,
+                'files_per_s': files / wall_time if wall_time else 0.0,
+                'mb_per_s': megabytes / wall_time if wall_time else 0.0,
+                'stages': stages
+            }
+        return summary
+
+    def format_summary(self):
+        """Resumen legible, una línea por formato y etapa"""
+        lines = []
+        for file_format, data in self.summary().items():
+            statuses = ', '.join(f"{status} {count}" for status, count in data['statuses'].items())
+            lines.append(f"{file_format}: {data['files']} archivos ({statuses}), "
+                         f"{data['files_per_s']:.1f} archivos/s, {data['mb_per_s']:.2f} MB/s")
+            for stage, stats in data['stages'].items():
+                lines.append(f"   {stage:<9} p50 {stats['p50_ms']:8.1f} ms  "
+                             f"p95 {stats['p95_ms']:8.1f} ms  p99 {stats['p99_ms']:8.1f} ms")
+        return '\n'.join(lines)
+
+    def to_json(self, path=None):
+        """Exporta el resumen como JSON; con path también lo guarda en disco"""
+        data = json.dumps({'wall_time_s': self.wall_time(),
+                           'formats': self.summary()}, indent=2)
+        if path:
+            directory = os.path.dirname(str(path))
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(data)
+        return data
+
+    def reset(self):
+        """Descarta las métricas acumuladas"""
+        self.__init__()
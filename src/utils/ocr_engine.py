@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Motor OCR con pool de workers Tesseract persistentes
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytesseract
+from PIL import Image
+
+# tesserocr mantiene el modelo de idioma cargado entre imágenes (opcional)
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class OCREngine:
+    """Motor OCR con pool de APIs Tesseract de larga duración
+
+    Cada worker conserva su instancia de Tesseract con el traineddata ya
+    cargado. Si tesserocr no está disponible (o falla al iniciar) se usa
+    pytesseract, que lanza un proceso por imagen.
+    """
+
+    def __init__(self, lang='spa', workers=2, psm=6, oem=3):
+        self.lang = lang
+        self.workers = max(1, workers)
+        self.psm = psm
+        self.oem = oem
+        self._pools = {}
+        self._executor = None
+        self._pool_failed = False
+        self._lock = threading.Lock()
+        self._stats = {'images': 0, 'total_latency': 0.0, 'pool': 0, 'fallback': 0}
+
+    def __getstate__(self):
+        # Los pools de Tesseract no cruzan procesos; se recrean bajo demanda
+        state = self.__dict__.copy()
+        state['_pools'] = {}
+        state['_executor'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def pool_available(self):
+        """Indica si se puede usar el pool persistente"""
+        return TESSEROCR_AVAILABLE and not self._pool_failed
+
+    def _get_pool(self, lang):
+        """Obtiene (o crea) el pool de APIs para un idioma"""
+        with self._lock:
+            pool = self._pools.get(lang)
+            if pool is None:
+                pool = queue.Queue()
+                for _ in range(self.workers):
+                    pool.put(PyTessBaseAPI(lang=lang, psm=PSM(self.psm), oem=OEM(self.oem)))
+                self._pools[lang] = pool
+            return pool
+
+    def _recognize_pool(self, pool, image):
+        """OCR con una API del pool (el modelo ya está cargado)"""
+        api = pool.get()
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            pool.put(api)
+
+    def _recognize_fallback(self, image, lang):
+        """OCR lanzando tesseract con pytesseract"""
+        config = f'--oem {self.oem} --psm {self.psm}'
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+
+    def recognize(self, image, lang=None):
+        """Reconoce el texto de una imagen (array numpy o PIL)
+
+        Retorna un dict con 'text', 'latency' (segundos) y 'engine'.
+        """
+        lang = lang or self.lang
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+
+        start = time.perf_counter()
+        engine = 'fallback'
+        text = None
+        if self.pool_available:
+            try:
+                pool = self._get_pool(lang)
+            except Exception as e:
+                # Solo un fallo al iniciar Tesseract desactiva el pool
+                logger.warning("Pool OCR no disponible, usando pytesseract: %s", e)
+                self._pool_failed = True
+            else:
+                try:
+                    text = self._recognize_pool(pool, image)
+                    engine = 'pool'
+                except Exception as e:
+                    logger.warning("Error de OCR en el pool, reintentando con pytesseract: %s", e)
+        if text is None:
+            text = self._recognize_fallback(image, lang)
+        latency = time.perf_counter() - start
+
+        with self._lock:
+            self._stats['images'] += 1
+            self._stats['total_latency'] += latency
+            self._stats[engine] += 1
+
+        return {'text': text, 'latency': latency, 'engine': engine}
+
+    def submit_batch(self, images, lang=None):
+        """Reconoce un lote de imágenes en paralelo, conservando el orden"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return list(self._executor.map(lambda image: self.recognize(image, lang), images))
+
+    def get_stats(self):
+        """Retorna el número de imágenes y la latencia media por imagen"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['mean_latency'] = (stats['total_latency'] / stats['images']
+                                 if stats['images'] else 0.0)
+        return stats
+
+    def close(self):
+        """Libera las APIs de Tesseract y el executor"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            for pool in self._pools.values():
+                while not pool.empty():
+                    pool.get().End()
+            self._pools = {}
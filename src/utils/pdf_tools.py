@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Utilidades de PDF: extracción por páginas, detección de páginas escaneadas y rasterizado
+"""
+
+import os
+import time
+
+import numpy as np
+import PyPDF2
+
+# Rasterizadores opcionales (el primero disponible se usa)
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+try:
+    from pdf2image import convert_from_bytes, convert_from_path
+    PDF2IMAGE_AVAILABLE = True
+except ImportError:
+    PDF2IMAGE_AVAILABLE = False
+
+# Mínimo de caracteres útiles para considerar que una página tiene texto
+MIN_PAGE_CHARS = 20
+
+
+def has_text_layer(page_text, min_chars=MIN_PAGE_CHARS):
+    """Indica si el texto extraído de una página es utilizable"""
+    if not page_text:
+        return False
+    return sum(1 for char in page_text if char.isalnum()) >= min_chars
+
+
+def can_render_pages():
+    """Indica si hay algún rasterizador de PDF instalado"""
+    return PDFIUM_AVAILABLE or PDF2IMAGE_AVAILABLE
+
+
+def render_page(pdf_path, page_index, dpi=200):
+    """Rasteriza una sola página a un array RGB (None si no es posible)
+
+    pdf_path puede ser también un buffer en memoria (io.BytesIO).
+    """
+    in_memory = not isinstance(pdf_path, (str, os.PathLike))
+    if PDFIUM_AVAILABLE:
+        pdf = pdfium.PdfDocument(pdf_path.getvalue() if in_memory else pdf_path)
+        try:
+            page = pdf[page_index]
+            bitmap = page.render(scale=dpi / 72)
+            return np.asarray(bitmap.to_pil().convert('RGB'))
+        finally:
+            pdf.close()
+
+    if PDF2IMAGE_AVAILABLE:
+        convert = convert_from_bytes if in_memory else convert_from_path
+        images = convert(pdf_path.getvalue() if in_memory else pdf_path, dpi=dpi,
+                         first_page=page_index + 1, last_page=page_index + 1)
+        if images:
+            return np.asarray(images[0].convert('RGB'))
+
+    return None
+
+
+def iter_pages(reader, page_indices):
+    """Genera (texto, segundos) de las páginas indicadas, una a una"""
+    for page_index in page_indices:
+        start = time.perf_counter()
+        text = reader.pages[page_index].extract_text() or ""
+        yield text, time.perf_counter() - start
+
+
+def extract_pages(reader, page_indices):
+    """Extrae el texto de las páginas indicadas con su tiempo en segundos"""
+    return list(iter_pages(reader, page_indices))
+
+
+def extract_page_range(pdf_path, start, stop):
+    """Abre el PDF y extrae las páginas [start, stop) (unidad de trabajo paralela)"""
+    with open(pdf_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return extract_pages(reader, range(start, stop))
+
+
+def split_page_ranges(num_pages, parts):
+    """Divide num_pages en como máximo parts rangos contiguos [start, stop)"""
+    parts = max(1, min(parts, num_pages))
+    size, extra = divmod(num_pages, parts)
+    ranges = []
+    start = 0
+    for part in range(parts):
+        stop = start + size + (1 if part < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
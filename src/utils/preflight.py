@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Inspección previa de archivos: tamaño y dimensiones sin decodificar el contenido
+"""
+
+import os
+import zipfile
+
+from PIL import Image
+
+IMAGE_FORMATS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff'}
+
+# Factores de reducción que cv2.IMREAD_REDUCED_* admite al decodificar
+REDUCTION_FACTORS = (2, 4, 8)
+
+# Por encima de max_file_size_mb * OVERSIZE_SKIP_FACTOR el archivo se omite
+OVERSIZE_SKIP_FACTOR = 10
+
+# Presupuesto aplicado a los documentos que superan max_file_size_mb
+OVERSIZED_BUDGET = {'max_pages': 10, 'max_ocr_pages': 2, 'max_chars': 200000}
+
+
+def image_dimensions(image_path):
+    """Retorna (ancho, alto) leyendo solo la cabecera de la imagen"""
+    with Image.open(image_path) as image:
+        return image.size
+
+
+def docx_xml_size(docx_path):
+    """Tamaño descomprimido de word/document.xml según el índice del zip"""
+    with zipfile.ZipFile(docx_path) as archive:
+        return archive.getinfo('word/document.xml').file_size
+
+
+def reduction_factor(num_pixels, max_pixels):
+    """Menor factor de reducción que deja la imagen bajo max_pixels
+
+    Retorna 1 si no hace falta reducir y None si ni el mayor factor basta.
+    """
+    if num_pixels <= max_pixels:
+        return 1
+    for factor in REDUCTION_FACTORS:
+        if num_pixels / (factor * factor) <= max_pixels:
+            return factor
+    return None
+
+
+def file_size(source):
+    """Tamaño en bytes de una ruta o de un buffer en memoria"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    return source.getbuffer().nbytes
+
+
+def inspect_file(file_path, max_file_size_mb=None, max_image_pixels=None, name=None):
+    """Decide cómo procesar un archivo antes de abrirlo con su extractor
+
+    Retorna un dict con 'action' ('full', 'downsample', 'truncate' o
+    'skip'), 'size_mb' y, según el caso, 'reduction' (factor para las
+    imágenes) y 'reason'. Las imágenes grandes se decodifican reducidas,
+    los PDF, DOCX y TXT grandes se leen con OVERSIZED_BUDGET y lo que supera
+    OVERSIZE_SKIP_FACTOR veces el límite (o no admite lectura parcial)
+    se omite. file_path puede ser un buffer en memoria (io.BytesIO); en
+    ese caso el formato se toma de name.
+    """
+    size_mb = file_size(file_path) / (1024 * 1024)
+    plan = {'action': 'full', 'size_mb': round(size_mb, 2)}
+    file_ext = os.path.splitext((name or file_path).lower())[1]
+    limit_mb = max_file_size_mb
+
+    if file_ext in IMAGE_FORMATS:
+        try:
+            width, height = image_dimensions(file_path)
+        except Image.DecompressionBombError:
+            return dict(plan, action='skip', reason='imagen demasiado grande para decodificar')
+        except OSError:
+            # Cabecera ilegible: el extractor reportará el error
+            return plan
+
+        factor = 1
+        if max_image_pixels:
+            factor = reduction_factor(width * height, max_image_pixels)
+            if factor is None:
+                return dict(plan, action='skip', reason=f'imagen de {width}x{height} píxeles')
+        if limit_mb and size_mb > limit_mb:
+            factor = max(factor, REDUCTION_FACTORS[0])
+        if factor > 1:
+            plan.update(action='downsample', reduction=factor,
+                        reason=f'imagen de {width}x{height} píxeles y {size_mb:.1f} MB')
+        return plan
+
+    if not limit_mb:
+        return plan
+
+    if file_ext == '.docx':
+        # El tamaño en disco suele venir de imágenes incrustadas que el
+        # extractor no lee; lo relevante es el XML del cuerpo
+        try:
+            size_mb = docx_xml_size(file_path) / (1024 * 1024)
+        except (zipfile.BadZipFile, KeyError):
+            return plan
+
+    if size_mb <= limit_mb:
+        return plan
+    if size_mb > limit_mb * OVERSIZE_SKIP_FACTOR:
+        return dict(plan, action='skip',
+                    reason=f'{size_mb:.1f} MB supera {limit_mb * OVERSIZE_SKIP_FACTOR} MB')
+    if file_ext in ('.pdf', '.docx', '.txt'):
+        return dict(plan, action='truncate', reason=f'{size_mb:.1f} MB supera {limit_mb} MB')
+    return dict(plan, action='skip', reason=f'{size_mb:.1f} MB supera {limit_mb} MB')
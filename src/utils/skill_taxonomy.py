@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Taxonomía de habilidades y educación cargada desde archivo, con recarga en caliente
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from .keyword_matcher import KeywordMatcher
+from .text_normalization import fold_accents
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).parent.parent / "config" / "skills_taxonomy.json"
+
+
+class SkillTaxonomy:
+    """Vocabulario de habilidades agrupado por profesión, compilado en un matcher
+
+    El archivo (JSON o YAML) tiene la forma:
+        {"education": {"universidad": ["sinónimo", ...], ...},
+         "skills": {"Grupo": {"python": ["sinónimo", ...], ...}, ...}}
+
+    Se comprueba la fecha de modificación como mucho cada check_interval
+    segundos y, si cambió, se recompila sin reiniciar el proceso. Si el
+    archivo nuevo es inválido se conserva la versión anterior.
+    """
+
+    def __init__(self, path=DEFAULT_TAXONOMY_PATH, check_interval=2.0):
+        self.path = str(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._last_check = 0.0
+        self.load()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _read_file(self):
+        """Lee el archivo de taxonomía (YAML si la extensión lo indica)"""
+        with open(self.path, 'r', encoding='utf-8') as file:
+            if self.path.endswith(('.yaml', '.yml')):
+                import yaml
+                return yaml.safe_load(file)
+            return json.load(file)
+
+    def load(self):
+        """Carga y compila la taxonomía"""
+        mtime = os.path.getmtime(self.path)
+        data = self._read_file()
+
+        education = list(data.get('education', {}))
+        skill_groups = {}
+        skill_keywords = []
+        term_map = {}
+
+        for canonical, synonyms in data.get('education', {}).items():
+            for term in [canonical] + list(synonyms or []):
+                term_map.setdefault(term, []).append(('education', canonical, None))
+
+        for group, skills in data.get('skills', {}).items():
+            skill_groups[group] = list(skills)
+            for canonical, synonyms in skills.items():
+                if canonical not in skill_keywords:
+                    skill_keywords.append(canonical)
+                for term in [canonical] + list(synonyms or []):
+                    term_map.setdefault(term, []).append(('skill', canonical, group))
+
+        # Variantes sin tildes para textos escritos o normalizados sin acentos
+        for term, targets in list(term_map.items()):
+            folded = fold_accents(term)
+            if folded != term:
+                for target in targets:
+                    if target not in term_map.setdefault(folded, []):
+                        term_map[folded].append(target)
+
+        matcher = KeywordMatcher(term_map)
+
+        # Sustituir todo de una vez para no exponer un estado a medias
+        self.education_keywords = education
+        self.skill_keywords = skill_keywords
+        self.skill_groups = skill_groups
+        self.term_map = term_map
+        self.matcher = matcher
+        self.version = data.get('version')
+        self._mtime = mtime
+
+    def maybe_reload(self):
+        """Recarga la taxonomía si el archivo cambió (limitado por check_interval)"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        with self._lock:
+            self._last_check = now
+            try:
+                if os.path.getmtime(self.path) == self._mtime:
+                    return False
+                self.load()
+                logger.info("Taxonomía recargada desde %s", self.path)
+                return True
+            except Exception as e:
+                logger.warning("Error recargando la taxonomía %s: %s", self.path, e)
+                return False
+
+    def match(self, text):
+        """Busca en el texto todas las habilidades y keywords de educación
+
+        Los sinónimos y las variantes sin tildes se reportan con su término
+        canónico.
+        """
+        self.maybe_reload()
+        term_map = self.term_map
+
+        positions = {}
+        for position, term in self.matcher.finditer(text):
+            for _, canonical, _ in term_map[term]:
+                positions.setdefault(canonical, []).append(position)
+
+        education = [k for k in self.education_keywords if k in positions]
+        skills = [k for k in self.skill_keywords if k in positions]
+        skill_groups = {}
+        for group, group_skills in self.skill_groups.items():
+            found = [k for k in group_skills if k in positions]
+            if found:
+                skill_groups[group] = found
+
+        return {
+            'education_keywords': education,
+            'skills': skills,
+            'skill_groups': skill_groups,
+            'keyword_counts': {k: len(v) for k, v in positions.items()},
+            'keyword_positions': positions
+        }
+
+
+_default_taxonomy = None
+
+
+def get_default_taxonomy():
+    """Taxonomía compartida cargada desde DEFAULT_TAXONOMY_PATH"""
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        _default_taxonomy = SkillTaxonomy()
+    return _default_taxonomy
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Normalización de texto: plegado de acentos, normalización Unicode y decodificación
+"""
+
+import codecs
+import re
+import unicodedata
+
+# Letras que se conservan al plegar acentos (forman parte del alfabeto español)
+_KEEP_CHARS = set('ñÑ')
+
+
+def _build_accent_table():
+    """Tabla de traducción de letras latinas acentuadas a su letra base"""
+    table = {}
+    for code in range(0x00C0, 0x0250):
+        char = chr(code)
+        if char in _KEEP_CHARS:
+            continue
+        base = ''.join(c for c in unicodedata.normalize('NFD', char)
+                       if not unicodedata.combining(c))
+        if base and base != char and base.isascii():
+            table[code] = base
+    return table
+
+
+ACCENT_TABLE = _build_accent_table()
+_ACCENT_MAP = {chr(code): base for code, base in ACCENT_TABLE.items()}
+# Las letras acentuadas son escasas: sustituir solo donde aparecen es mucho
+# más rápido que str.translate, que recorre todo el texto en Python
+_ACCENT_PATTERN = re.compile('[' + ''.join(map(re.escape, _ACCENT_MAP)) + ']')
+
+
+def _replace_accent(match):
+    return _ACCENT_MAP[match.group()]
+
+
+def fold_accents(text):
+    """Quita tildes y diéresis ('ingeniería' -> 'ingenieria'), conservando la ñ"""
+    if text.isascii():
+        return text
+    return _ACCENT_PATTERN.sub(_replace_accent, text)
+
+
+def normalize_unicode(text):
+    """Normalización NFKC (ligaduras, caracteres de ancho completo, etc.)"""
+    return unicodedata.normalize('NFKC', text)
+
+
+# Marcas de orden de bytes reconocidas al inicio de un archivo de texto
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def decode_text(data, final=True):
+    """Decodifica bytes de un archivo de texto; retorna (texto, codificación)
+
+    La BOM (UTF-8 o UTF-16) se detecta en los primeros bytes; sin BOM se
+    valida UTF-8 y, si falla, se usa cp1252 y por último Latin-1, que
+    acepta cualquier byte. Con final=False los datos son un prefijo y un
+    carácter multibyte cortado al final no invalida el UTF-8.
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            break
+    else:
+        encoding = None
+
+    candidates = [encoding] if encoding else ['utf-8', 'cp1252']
+    for encoding in candidates:
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            return decoder.decode(data, final=final), encoding
+        except UnicodeDecodeError:
+            continue
+    return data.decode('latin-1'), 'latin-1'
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Ejecución aislada de tareas con límite de tiempo y de memoria por tarea
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+logger = logging.getLogger(__name__)
+
+# Cada cuánto se mide la memoria de los workers ocupados
+MEMORY_POLL_INTERVAL = 0.5
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _rss_bytes(pid):
+    """Memoria residente de un proceso según /proc (None si no está disponible)"""
+    try:
+        with open(f'/proc/{pid}/statm', 'rb') as file:
+            return int(file.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _worker_main(conn, func):
+    """Bucle del proceso worker: recibe tareas y devuelve resultados"""
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+
+        task_id, args = task
+        try:
+            outcome = ('ok', func(*args))
+        except MemoryError:
+            outcome = ('crashed', 'MemoryError: se superó el límite de memoria')
+        except Exception as e:
+            outcome = ('error', f'{type(e).__name__}: {e}')
+
+        try:
+            conn.send((task_id, outcome))
+        except MemoryError:
+            conn.send((task_id, ('crashed', 'MemoryError al enviar el resultado')))
+
+
+class _Worker:
+    """Proceso worker con su conexión y la tarea en curso"""
+
+    def __init__(self, context, func):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, func),
+                                       daemon=True)
+        self.process.start()
+        # Cerrar nuestra copia del extremo hijo para detectar su muerte (EOF)
+        child_conn.close()
+        self.task_id = None
+        self.deadline = None
+        self.base_rss = None
+
+    def submit(self, task_id, args, timeout, measure_memory=False):
+        self.task_id = task_id
+        self.deadline = time.monotonic() + timeout if timeout else None
+        # El worker está inactivo: su RSS actual es la base de esta tarea
+        self.base_rss = _rss_bytes(self.process.pid) if measure_memory else None
+        self.conn.send((task_id, args))
+
+    def memory_growth(self):
+        """Bytes de RSS por encima de la base de la tarea en curso"""
+        if self.base_rss is None:
+            return 0
+        rss = _rss_bytes(self.process.pid)
+        return rss - self.base_rss if rss is not None else 0
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class IsolatedExecutor:
+    """Pool de procesos vigilado: cada tarea tiene timeout y techo de memoria
+
+    Una tarea que supera el tiempo se mata junto con su proceso (estado
+    'timeout'); si el proceso muere o se queda sin memoria el estado es
+    'crashed'. En ambos casos el worker se reemplaza y el resto del lote
+    continúa. Los resultados se generan en el orden de entrada.
+
+    El techo de memoria se vigila desde el proceso padre: cada
+    MEMORY_POLL_INTERVAL segundos se lee el RSS de los workers ocupados
+    (/proc, solo Linux) y se mata al que crece más de memory_limit_mb
+    sobre su RSS al recibir la tarea. No se usa RLIMIT_AS porque limita el
+    espacio virtual, que en un proceso hijo de la GUI (Qt, BLAS,
+    TensorFlow) ya puede superar el límite antes de empezar.
+
+    Los workers son daemon y no pueden crear procesos hijos; el código que
+    ejecutan debe comprobarlo (CVProcessor lee los PDFs en serie).
+    """
+
+    def __init__(self, func, workers=1, timeout=None, memory_limit_mb=None):
+        self.func = func
+        self.workers = max(1, workers or 1)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._context = multiprocessing.get_context()
+        if memory_limit_mb and _rss_bytes(os.getpid()) is None:
+            logger.warning("No se puede medir la memoria de los procesos en este sistema; "
+                           "se ignora memory_limit_mb")
+            self.memory_limit_mb = None
+
+    def _new_worker(self):
+        return _Worker(self._context, self.func)
+
+    def map(self, args_iterable):
+        """Genera (estado, resultado o mensaje) por cada tupla de argumentos
+
+        estado es 'ok', 'error', 'timeout' o 'crashed'.
+        """
+        tasks = iter(args_iterable)
+        max_pending = self.workers * 4
+        workers = [self._new_worker() for _ in range(self.workers)]
+        results = {}
+        next_task = 0
+        next_yield = 0
+        exhausted = False
+
+        try:
+            while True:
+                # Asignar tareas a los workers libres sin adelantarse demasiado
+                for worker in workers:
+                    if worker.task_id is not None or exhausted:
+                        continue
+                    if next_task - next_yield >= max_pending:
+                        break
+                    try:
+                        args = next(tasks)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    worker.submit(next_task, args, self.timeout,
+                                  measure_memory=bool(self.memory_limit_mb))
+                    next_task += 1
+
+                # Entregar en orden los resultados ya disponibles
+                while next_yield in results:
+                    yield results.pop(next_yield)
+                    next_yield += 1
+
+                busy = [worker for worker in workers if worker.task_id is not None]
+                if not busy:
+                    if exhausted:
+                        break
+                    continue
+
+                deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+                wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                if self.memory_limit_mb:
+                    wait_timeout = min(wait_timeout if wait_timeout is not None
+                                       else MEMORY_POLL_INTERVAL, MEMORY_POLL_INTERVAL)
+                ready = wait([worker.conn for worker in busy], timeout=wait_timeout)
+
+                for index, worker in enumerate(workers):
+                    if worker.task_id is None:
+                        continue
+
+                    if worker.conn in ready:
+                        try:
+                            task_id, outcome = worker.conn.recv()
+                            results[task_id] = outcome
+                            worker.task_id = None
+                            continue
+                        except (EOFError, OSError):
+                            # El proceso murió (segfault, OOM killer, etc.)
+                            worker.process.join(timeout=1)
+                            code = worker.process.exitcode
+                            results[worker.task_id] = ('crashed', f'El proceso terminó (código {code})')
+                            worker.kill()
+                            workers[index] = self._new_worker()
+                            continue
+
+                    if worker.deadline is not None and time.monotonic() >= worker.deadline:
+                        results[worker.task_id] = ('timeout', f'Se superaron {self.timeout}s')
+                        worker.kill()
+                        workers[index] = self._new_worker()
+                    elif (self.memory_limit_mb
+                          and worker.memory_growth() > self.memory_limit_mb * 1024 * 1024):
+                        results[worker.task_id] = (
+                            'crashed', f'Se superaron {self.memory_limit_mb} MB de memoria'
+                        )
+                        worker.kill()
+                        workers[index] = self._new_worker()
+
+            while next_yield in results:
+                yield results.pop(next_yield)
+                next_yield += 1
+        finally:
+            for worker in workers:
+                if worker.task_id is not None:
+                    worker.kill()
+                else:
+                    worker.stop()